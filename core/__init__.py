@@ -12,9 +12,10 @@ from .models import (
 from .exceptions import (
     LangExtractorError, FileAccessError, OCRProcessingError, APIError,
     ExtractionError, ExportError, ConfigurationError, ValidationError,
-    CredentialError, APIValidationError, ErrorCategory, ErrorSeverity,
-    handle_error
+    CredentialError, APIValidationError, OperationCancelledError,
+    ErrorCategory, ErrorSeverity, handle_error
 )
+from .cancellation import CancelToken
 
 __all__ = [
     # Credential Management
@@ -37,6 +38,9 @@ __all__ = [
     # Exceptions
     'LangExtractorError', 'FileAccessError', 'OCRProcessingError', 'APIError',
     'ExtractionError', 'ExportError', 'ConfigurationError', 'ValidationError',
-    'CredentialError', 'APIValidationError', 'ErrorCategory', 'ErrorSeverity',
-    'handle_error'
+    'CredentialError', 'APIValidationError', 'OperationCancelledError',
+    'ErrorCategory', 'ErrorSeverity', 'handle_error',
+    
+    # Cancellation
+    'CancelToken'
 ]
\ No newline at end of file
@@ -16,6 +16,8 @@ from decimal import Decimal, InvalidOperation
 import re
 from collections import defaultdict, Counter
 
+import numpy as np
+
 from .models import (
     ExtractionResult, ExtractionTemplate, ExtractionField, FieldType, 
     ProcessingSession, ProcessingStatus
@@ -24,6 +26,9 @@ from .exceptions import ValidationError, LangExtractorError, ErrorCategory
 
 logger = logging.getLogger(__name__)
 
+# Characters stripped from numbers after separator normalization
+_NON_NUMERIC_PATTERN = re.compile(r'[^\d.-]')
+
 
 class Aggregator:
     """
@@ -33,6 +38,14 @@ class Aggregator:
     and error reporting for extracted data across multiple files.
     """
     
+    # Converter per field type, called with (self, stripped value, field)
+    _FIELD_CONVERTERS = {
+        FieldType.TEXT: lambda self, value, field: value,
+        FieldType.NUMBER: lambda self, value, field: self._convert_to_number(value, field.number_locale),
+        FieldType.DATE: lambda self, value, field: self._convert_to_date(value),
+        FieldType.CURRENCY: lambda self, value, field: self._convert_to_currency(value, field.number_locale),
+    }
+    
     def __init__(self, template: ExtractionTemplate):
         """
         Initialize aggregator with extraction template.
@@ -173,20 +186,11 @@ class Aggregator:
         # Convert to string first for consistent processing
         str_value = str(value).strip()
         
-        if field.type == FieldType.TEXT:
-            return str_value
-        
-        elif field.type == FieldType.NUMBER:
-            return self._convert_to_number(str_value, field.number_locale)
-        
-        elif field.type == FieldType.DATE:
-            return self._convert_to_date(str_value)
-        
-        elif field.type == FieldType.CURRENCY:
-            return self._convert_to_currency(str_value, field.number_locale)
-        
-        else:
+        converter = self._FIELD_CONVERTERS.get(field.type)
+        if converter is None:
             raise ValueError(f"Unsupported field type: {field.type}")
+        
+        return converter(self, str_value, field)
     
     def _convert_to_number(self, value: str, locale: str = 'vi-VN') -> Union[int, float]:
         """Convert string to number based on locale."""
@@ -209,7 +213,7 @@ class Aggregator:
             value = value.replace(',', '')
         
         # Remove any remaining non-numeric characters except decimal point and minus
-        value = re.sub(r'[^\d.-]', '', value)
+        value = _NON_NUMERIC_PATTERN.sub('', value)
         
         # Handle empty or invalid values
         if not value or value == '.':
@@ -283,7 +287,11 @@ class Aggregator:
         successful_files = len([d for d in aggregated_data if d['status'] == ProcessingStatus.COMPLETED.value])
         
         # Overall processing statistics
-        processing_times = [d['processing_time'] for d in aggregated_data if d['processing_time'] > 0]
+        processing_times = np.fromiter(
+            (d['processing_time'] for d in aggregated_data), dtype=float, count=total_files
+        )
+        processing_times = processing_times[processing_times > 0]
+        has_times = processing_times.size > 0
         
         summary = {
             'processing_summary': {
@@ -291,9 +299,9 @@ class Aggregator:
                 'successful_files': successful_files,
                 'failed_files': len(validation_errors),
                 'success_rate': (successful_files / total_files * 100) if total_files > 0 else 0,
-                'total_processing_time': sum(processing_times),
-                'average_processing_time': statistics.mean(processing_times) if processing_times else 0,
-                'median_processing_time': statistics.median(processing_times) if processing_times else 0
+                'total_processing_time': float(processing_times.sum()),
+                'average_processing_time': float(processing_times.mean()) if has_times else 0,
+                'median_processing_time': float(np.median(processing_times)) if has_times else 0
             },
             'data_quality_summary': {},
             'field_summaries': {}
@@ -343,22 +351,33 @@ class Aggregator:
         if values and field_config:
             if field_config.type in [FieldType.NUMBER, FieldType.CURRENCY]:
                 numeric_values = [v for v in values if isinstance(v, (int, float, Decimal))]
-                if numeric_values:
+                if any(isinstance(v, Decimal) for v in numeric_values):
+                    # Currency amounts keep exact Decimal arithmetic
+                    decimals = [v if isinstance(v, Decimal) else Decimal(str(v)) for v in numeric_values]
+                    summary.update({
+                        'min_value': min(decimals),
+                        'max_value': max(decimals),
+                        'mean_value': statistics.mean(decimals),
+                        'median_value': statistics.median(decimals),
+                        'std_deviation': statistics.stdev(decimals) if len(decimals) > 1 else 0
+                    })
+                elif numeric_values:
+                    array = np.asarray(numeric_values, dtype=float)
                     summary.update({
-                        'min_value': min(numeric_values),
-                        'max_value': max(numeric_values),
-                        'mean_value': statistics.mean(numeric_values),
-                        'median_value': statistics.median(numeric_values),
-                        'std_deviation': statistics.stdev(numeric_values) if len(numeric_values) > 1 else 0
+                        'min_value': numeric_values[int(array.argmin())],
+                        'max_value': numeric_values[int(array.argmax())],
+                        'mean_value': float(array.mean()),
+                        'median_value': float(np.median(array)),
+                        'std_deviation': float(array.std(ddof=1)) if array.size > 1 else 0
                     })
             
             elif field_config.type == FieldType.TEXT:
-                text_lengths = [len(str(v)) for v in values]
-                if text_lengths:
+                text_lengths = np.fromiter((len(str(v)) for v in values), dtype=np.int64, count=len(values))
+                if text_lengths.size:
                     summary.update({
-                        'min_length': min(text_lengths),
-                        'max_length': max(text_lengths),
-                        'avg_length': statistics.mean(text_lengths)
+                        'min_length': int(text_lengths.min()),
+                        'max_length': int(text_lengths.max()),
+                        'avg_length': float(text_lengths.mean())
                     })
             
             elif field_config.type == FieldType.DATE:
@@ -0,0 +1,101 @@
+"""
+Cooperative cancellation support for long-running processing steps.
+
+A CancelToken is handed to the ingestion and extraction components, which
+check it between units of work (PDF pages, text chunks) so a cancelled run
+stops promptly instead of finishing the file in the background.
+"""
+
+import time
+from threading import Event
+from typing import Optional
+
+from .exceptions import OperationCancelledError
+
+
+class CancelToken:
+    """Thread-safe flag signalling that the current operation should stop."""
+    
+    def __init__(self, event: Optional[Event] = None):
+        """
+        Initialize cancel token.
+        
+        Args:
+            event: Existing Event to share cancellation state with (optional)
+        """
+        self._event = event or Event()
+    
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+    
+    def is_cancelled(self) -> bool:
+        """Check whether cancellation has been requested."""
+        return self._event.is_set()
+    
+    def wait(self, timeout: float) -> bool:
+        """
+        Sleep until cancellation is requested or the timeout elapses.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            bool: True if the token was cancelled
+        """
+        self._event.wait(timeout)
+        return self.is_cancelled()
+    
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise if cancellation has been requested.
+        
+        Raises:
+            OperationCancelledError: If the token has been cancelled
+        """
+        if self._event.is_set():
+            raise OperationCancelledError()
+    
+    def with_timeout(self, seconds: float) -> "CancelToken":
+        """
+        Derive a token that is also cancelled once a time limit has passed.
+        
+        Args:
+            seconds: Time limit, counted from now
+            
+        Returns:
+            CancelToken: Token sharing this token's cancellation state
+        """
+        return _DeadlineCancelToken(self._event, time.monotonic() + seconds)
+
+
+class _DeadlineCancelToken(CancelToken):
+    """Cancel token that additionally expires at a monotonic deadline."""
+    
+    def __init__(self, event: Event, deadline: float):
+        super().__init__(event)
+        self._deadline = deadline
+    
+    def is_expired(self) -> bool:
+        """Check whether the deadline has passed."""
+        return time.monotonic() >= self._deadline
+    
+    def is_cancelled(self) -> bool:
+        """Check whether cancellation has been requested or the deadline passed."""
+        return self._event.is_set() or self.is_expired()
+    
+    def wait(self, timeout: float) -> bool:
+        """Sleep until cancelled, the deadline passes or the timeout elapses."""
+        return super().wait(max(0.0, min(timeout, self._deadline - time.monotonic())))
+    
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise if cancellation has been requested or the deadline passed.
+        
+        Raises:
+            OperationCancelledError: If the token has been cancelled or expired
+        """
+        if self._event.is_set():
+            raise OperationCancelledError()
+        if self.is_expired():
+            raise OperationCancelledError("Operation timed out")
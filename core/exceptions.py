@@ -16,6 +16,7 @@ class ErrorCategory(Enum):
     CONFIGURATION_ERROR = "configuration_error"
     VALIDATION_ERROR = "validation_error"
     NETWORK_ERROR = "network_error"
+    CANCELLED = "cancelled"
 
 
 class ErrorSeverity(Enum):
@@ -339,6 +340,20 @@ class APIValidationError(LangExtractorError):
         )
 
 
+class OperationCancelledError(LangExtractorError):
+    """Operation stopped because the user cancelled processing."""
+    
+    def __init__(
+        self,
+        message: str = "Processing cancelled by user"
+    ):
+        super().__init__(
+            message=message,
+            category=ErrorCategory.CANCELLED,
+            severity=ErrorSeverity.LOW
+        )
+
+
 def handle_error(
     error: Exception,
     logger,
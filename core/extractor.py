@@ -5,9 +5,15 @@ This module provides the Extractor class that handles structured data extraction
 from text using AI-powered extraction with PII masking and validation.
 """
 
+import functools
+import json
 import logging
+import re
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Optional, Dict, Any, List, Tuple
 import langextract as lx
 
 from .models import ExtractorInterface, ExtractionTemplate, ExtractionResult, FieldType, ProcessingStatus
@@ -19,11 +25,124 @@ from .exceptions import (
     ErrorSeverity,
     APIValidationError,
     CredentialError,
-    ValidationError
+    ValidationError,
+    OperationCancelledError
 )
+from .cancellation import CancelToken
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of extraction results kept for identical requests
+RESULT_CACHE_SIZE = 256
+
+# Numeric portion of a currency value, e.g. "1.234.567 VND" -> "1.234.567"
+_NUMERIC_PATTERN = re.compile(r'[\d,\.]+')
+
+
+def _convert_number(value: str) -> Any:
+    """Convert an extracted number, treating ',' and '.' as decimal separators."""
+    if '.' in value or ',' in value:
+        return float(value.replace(',', '.'))
+    return int(value)
+
+
+def _convert_currency(value: str) -> Any:
+    """Extract the numeric value from a currency string, if there is one."""
+    numeric_match = _NUMERIC_PATTERN.search(value)
+    if numeric_match:
+        return float(numeric_match.group().replace(',', '.'))
+    return value
+
+
+# Per-type conversion of extracted text; TEXT and DATE keep the string for now
+_FIELD_CONVERTERS = {
+    FieldType.NUMBER: _convert_number,
+    FieldType.CURRENCY: _convert_currency,
+}
+
+
+def _template_key(template: ExtractionTemplate) -> str:
+    """Build a stable cache key from the template parts used for extraction."""
+    return json.dumps(
+        {
+            'prompt_description': template.prompt_description,
+            'fields': [(f.name, f.type.value, f.description) for f in template.fields],
+            'examples': template.examples,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _compiled_template(template_key: str) -> tuple:
+    """
+    Convert a template (identified by its cache key) to langextract format.
+    
+    Cached so that every file processed with the same template reuses the
+    prompt and example objects built for the first one.
+    
+    Args:
+        template_key: Key produced by _template_key()
+        
+    Returns:
+        tuple: (prompt_description, examples) for langextract
+    """
+    data = json.loads(template_key)
+    prompt_description = data['prompt_description']
+    
+    # Convert examples if available
+    examples = []
+    for example_data in data['examples']:
+        if not isinstance(example_data, dict):
+            continue
+        
+        # Extract text and extractions from example
+        text = example_data.get('text', '')
+        extractions_data = example_data.get('extractions', [])
+        
+        # Convert extractions to langextract format
+        extractions = []
+        for ext_data in extractions_data:
+            if isinstance(ext_data, dict):
+                extraction = lx.data.Extraction(
+                    extraction_class=ext_data.get('field_name', 'unknown'),
+                    extraction_text=ext_data.get('value', ''),
+                    attributes=ext_data.get('attributes', {})
+                )
+                extractions.append(extraction)
+        
+        # Create langextract example
+        if text and extractions:
+            example = lx.data.ExampleData(
+                text=text,
+                extractions=extractions
+            )
+            examples.append(example)
+    
+    # If no examples provided, create a basic example from field definitions
+    if not examples:
+        logger.warning("No examples found in template, creating basic example")
+        # Create a minimal example based on field definitions
+        sample_extractions = []
+        for name, field_type, description in data['fields'][:3]:  # Limit to first 3 fields
+            extraction = lx.data.Extraction(
+                extraction_class=name,
+                extraction_text=f"sample_{name}",
+                attributes={"type": field_type, "description": description}
+            )
+            sample_extractions.append(extraction)
+        
+        if sample_extractions:
+            example = lx.data.ExampleData(
+                text="Sample text for extraction",
+                extractions=sample_extractions
+            )
+            examples.append(example)
+    
+    return prompt_description, examples
+
 
 class Extractor(ExtractorInterface):
     """
@@ -45,7 +164,8 @@ class Extractor(ExtractorInterface):
         max_char_buffer: int = 8000,
         extraction_passes: int = 1,
         keychain_manager: Optional[KeychainManager] = None,
-        pii_masker: Optional[PIIMasker] = None
+        pii_masker: Optional[PIIMasker] = None,
+        cache_results: bool = False
     ):
         """
         Initialize data extractor.
@@ -59,6 +179,7 @@ class Extractor(ExtractorInterface):
             extraction_passes: Number of extraction passes for better recall (default: 1)
             keychain_manager: Credential manager instance (optional)
             pii_masker: PII masker instance (optional)
+            cache_results: Reuse results of identical requests (default: False)
         """
         self.model_id = model_id
         self.api_timeout = api_timeout
@@ -74,8 +195,16 @@ class Extractor(ExtractorInterface):
         # Initialize logger
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
-        # Cache for API key
+        # Cache for API key; the lock lets a concurrent warmup() and the
+        # first extract() share a single load/validation round-trip
         self._api_key = None
+        self._api_key_lock = threading.Lock()
+        
+        # Opt-in LRU cache of non-empty results keyed by hash of the full
+        # request; setting cache_results to False bypasses it
+        self.cache_results = cache_results
+        self._result_cache: "OrderedDict[str, Tuple[Dict[str, Any], Dict[str, float]]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
         
         self.logger.info(f"Extractor initialized with model: {self.model_id}")
     
@@ -92,6 +221,13 @@ class Extractor(ExtractorInterface):
         if self._api_key is not None:
             return self._api_key
         
+        with self._api_key_lock:
+            if self._api_key is not None:
+                return self._api_key
+            return self._load_api_key()
+    
+    def _load_api_key(self) -> str:
+        """Load and validate the API key from the keychain (uncached)."""
         if self.offline_mode:
             raise LangExtractorError(
                 "Data extraction is disabled in offline mode",
@@ -122,6 +258,80 @@ class Extractor(ExtractorInterface):
                 raise
             raise CredentialError(f"Failed to load API key: {str(e)}")
     
+    def warmup(self, template: Optional[ExtractionTemplate] = None) -> bool:
+        """
+        Perform one-time setup ahead of the first extraction.
+        
+        Loads and validates the API key (the validation round-trip also opens
+        the connection to the Gemini API) and compiles the template, so the
+        first real extract() call does not pay for them. Errors are logged
+        and otherwise ignored; extract() reports them for the actual file.
+        
+        Args:
+            template: Template that will be used for extraction (optional)
+            
+        Returns:
+            bool: True if warmup completed without errors
+        """
+        try:
+            if template is not None:
+                self._convert_template_to_langextract(template)
+            if not self.offline_mode:
+                self._get_api_key()
+            self.logger.debug("Extractor warmup completed")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Extractor warmup failed: {str(e)}")
+            return False
+    
+    def _result_cache_key(self, template: ExtractionTemplate, masked_text: str) -> str:
+        """Build the result cache key for a masked text extracted with a template."""
+        request = "\0".join((
+            self.model_id,
+            str(self.max_char_buffer),
+            str(self.extraction_passes),
+            _template_key(template),
+            masked_text
+        ))
+        return blake2b(request.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _get_cached_result(self, cache_key: str) -> Optional[Tuple[Dict[str, Any], Dict[str, float]]]:
+        """Return copies of a previously extracted result for the same request, if any."""
+        if not self.cache_results:
+            return None
+        
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+        
+        if cached is None:
+            return None
+        self.logger.debug("Using cached extraction result")
+        return dict(cached[0]), dict(cached[1])
+    
+    def _store_result(
+        self,
+        cache_key: str,
+        extracted_data: Dict[str, Any],
+        confidence_scores: Dict[str, float]
+    ) -> None:
+        """Remember a non-empty extraction result, evicting the least recently used ones."""
+        # Empty results may be transient, so they are always retried
+        if not self.cache_results or not extracted_data:
+            return
+        
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = (dict(extracted_data), dict(confidence_scores))
+            self._result_cache.move_to_end(cache_key)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def clear_result_cache(self) -> None:
+        """Forget all cached extraction results."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+    
     def _convert_template_to_langextract(self, template: ExtractionTemplate) -> tuple:
         """
         Convert ExtractionTemplate to langextract format.
@@ -136,58 +346,7 @@ class Extractor(ExtractorInterface):
             ValidationError: If template format is invalid
         """
         try:
-            # Use template's prompt description
-            prompt_description = template.prompt_description
-            
-            # Convert examples if available
-            examples = []
-            for example_data in template.examples:
-                if not isinstance(example_data, dict):
-                    continue
-                
-                # Extract text and extractions from example
-                text = example_data.get('text', '')
-                extractions_data = example_data.get('extractions', [])
-                
-                # Convert extractions to langextract format
-                extractions = []
-                for ext_data in extractions_data:
-                    if isinstance(ext_data, dict):
-                        extraction = lx.data.Extraction(
-                            extraction_class=ext_data.get('field_name', 'unknown'),
-                            extraction_text=ext_data.get('value', ''),
-                            attributes=ext_data.get('attributes', {})
-                        )
-                        extractions.append(extraction)
-                
-                # Create langextract example
-                if text and extractions:
-                    example = lx.data.ExampleData(
-                        text=text,
-                        extractions=extractions
-                    )
-                    examples.append(example)
-            
-            # If no examples provided, create a basic example from field definitions
-            if not examples:
-                self.logger.warning("No examples found in template, creating basic example")
-                # Create a minimal example based on field definitions
-                sample_extractions = []
-                for field in template.fields[:3]:  # Limit to first 3 fields
-                    extraction = lx.data.Extraction(
-                        extraction_class=field.name,
-                        extraction_text=f"sample_{field.name}",
-                        attributes={"type": field.type.value, "description": field.description}
-                    )
-                    sample_extractions.append(extraction)
-                
-                if sample_extractions:
-                    example = lx.data.ExampleData(
-                        text="Sample text for extraction",
-                        extractions=sample_extractions
-                    )
-                    examples.append(example)
-            
+            prompt_description, examples = _compiled_template(_template_key(template))
             self.logger.info(f"Converted template with {len(examples)} examples")
             return prompt_description, examples
             
@@ -217,34 +376,25 @@ class Extractor(ExtractorInterface):
             
             # Handle langextract result format
             if hasattr(result, 'extractions') and result.extractions:
+                fields_by_name = {field.name: field for field in template.fields}
+                
                 for extraction in result.extractions:
                     field_name = extraction.extraction_class
                     field_value = extraction.extraction_text
                     
                     # Find corresponding field in template
-                    template_field = None
-                    for field in template.fields:
-                        if field.name == field_name:
-                            template_field = field
-                            break
+                    template_field = fields_by_name.get(field_name)
                     
                     if template_field:
+                        # Key by the template's own string so all results of a
+                        # template share key objects instead of each holding copies
+                        field_name = template_field.name
+                        
                         # Type conversion based on field type
+                        converter = _FIELD_CONVERTERS.get(template_field.type)
                         try:
-                            if template_field.type == FieldType.NUMBER:
-                                # Try to convert to number
-                                if '.' in field_value or ',' in field_value:
-                                    field_value = float(field_value.replace(',', '.'))
-                                else:
-                                    field_value = int(field_value)
-                            elif template_field.type == FieldType.CURRENCY:
-                                # Extract numeric value from currency
-                                import re
-                                numeric_match = re.search(r'[\d,\.]+', field_value)
-                                if numeric_match:
-                                    field_value = float(numeric_match.group().replace(',', '.'))
-                            # TEXT and DATE types keep as string for now
-                            
+                            if converter is not None:
+                                field_value = converter(field_value)
                         except (ValueError, TypeError):
                             self.logger.warning(f"Failed to convert field {field_name} to {template_field.type}")
                             # Keep original value if conversion fails
@@ -337,18 +487,25 @@ class Extractor(ExtractorInterface):
         self.logger.info(f"Merged {len(chunk_results)} chunk results into {len(merged_data)} fields")
         return merged_data, merged_confidence
 
-    def extract(self, text: str, template: ExtractionTemplate) -> ExtractionResult:
+    def extract(
+        self,
+        text: str,
+        template: ExtractionTemplate,
+        cancel_token: Optional[CancelToken] = None
+    ) -> ExtractionResult:
         """
         Extract structured data from text using template.
 
         Args:
             text: Input text to extract data from
             template: Extraction template configuration
+            cancel_token: Token checked before each API call (optional)
 
         Returns:
             ExtractionResult: Extraction results with data and metadata
 
         Raises:
+            OperationCancelledError: If extraction was cancelled
             LangExtractorError: If extraction fails
             ValidationError: If input validation fails
             APIValidationError: If API call fails
@@ -381,10 +538,19 @@ class Extractor(ExtractorInterface):
             # Get API key
             api_key = self._get_api_key()
 
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            # Identical requests reuse the result of an earlier extraction
+            cache_key = self._result_cache_key(template, masked_text)
+            cached = self._get_cached_result(cache_key)
+
             # Check if text needs chunking for large documents
-            text_chunks = self._chunk_text_if_needed(masked_text)
+            text_chunks = self._chunk_text_if_needed(masked_text) if cached is None else []
 
-            if len(text_chunks) == 1:
+            if cached is not None:
+                extracted_data, confidence_scores = cached
+            elif len(text_chunks) == 1:
                 # Single chunk processing
                 self.logger.info(f"Processing single chunk with model: {self.model_id}")
 
@@ -407,6 +573,8 @@ class Extractor(ExtractorInterface):
 
                 chunk_results = []
                 for i, chunk in enumerate(text_chunks):
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
                     self.logger.debug(f"Processing chunk {i+1}/{len(text_chunks)}")
 
                     chunk_result = lx.extract(
@@ -439,6 +607,9 @@ class Extractor(ExtractorInterface):
                 mock_result = MockResult(raw_data, raw_confidence)
                 extracted_data, confidence_scores = self._validate_extraction_result(mock_result, template)
 
+            if cached is None:
+                self._store_result(cache_key, extracted_data, confidence_scores)
+
             processing_time = time.time() - start_time
 
             # Create extraction result
@@ -454,6 +625,10 @@ class Extractor(ExtractorInterface):
             self.logger.info(f"Extraction completed successfully in {processing_time:.2f}s")
             return extraction_result
 
+        except OperationCancelledError:
+            self.logger.info("Extraction cancelled")
+            raise
+
         except Exception as e:
             processing_time = time.time() - start_time
 
@@ -469,12 +644,165 @@ class Extractor(ExtractorInterface):
 
             if isinstance(e, (LangExtractorError, ValidationError, APIValidationError)):
                 self.logger.error(f"Extraction failed: {str(e)}")
-                extraction_result.errors = [str(e)]
                 return extraction_result
             else:
                 self.logger.error(f"Unexpected error during extraction: {str(e)}")
                 raise LangExtractorError(
                     f"Extraction failed: {str(e)}",
-                    category=ErrorCategory.PROCESSING_ERROR,
+                    category=ErrorCategory.EXTRACTION_ERROR,
+                    severity=ErrorSeverity.HIGH
+                )
+
+    def extract_batch(
+        self,
+        texts: List[str],
+        template: ExtractionTemplate,
+        cancel_token: Optional[CancelToken] = None
+    ) -> List[ExtractionResult]:
+        """
+        Extract structured data from several texts with a single langextract call.
+
+        Texts that fit in one chunk are sent together as langextract documents,
+        so many small files share one request instead of paying one round-trip
+        each. Texts that are empty or need chunking are passed to extract().
+
+        Args:
+            texts: Input texts to extract data from
+            template: Extraction template configuration
+            cancel_token: Token checked before each API call (optional)
+
+        Returns:
+            List[ExtractionResult]: One result per input text, in input order
+
+        Raises:
+            OperationCancelledError: If extraction was cancelled
+            LangExtractorError: If extraction fails unexpectedly
+        """
+        results: List[Optional[ExtractionResult]] = [None] * len(texts)
+        batchable = [
+            i for i, text in enumerate(texts)
+            if isinstance(text, str) and text.strip() and len(text) <= self.max_char_buffer
+        ]
+
+        if len(batchable) < 2:
+            batchable = []
+        batched = set(batchable)
+        for i, text in enumerate(texts):
+            if i not in batched:
+                results[i] = self.extract(text, template, cancel_token=cancel_token)
+
+        if not batchable:
+            return results
+
+        start_time = time.time()
+
+        try:
+            if not isinstance(template, ExtractionTemplate):
+                raise ValidationError("Invalid template format")
+
+            if not template.fields:
+                raise ValidationError("Template must have at least one field")
+
+            self.logger.info(f"Starting batch extraction of {len(batchable)} texts with template: {template.name}")
+
+            prompt_description, examples = self._convert_template_to_langextract(template)
+            api_key = self._get_api_key()
+
+            # Apply PII masking before cloud processing; texts extracted
+            # before are answered from the result cache instead
+            documents = []
+            cache_keys = {}
+            for i in batchable:
+                text = texts[i]
+                if self.pii_masker and not self.offline_mode:
+                    text = self.pii_masker.mask_for_cloud(text)
+                cache_key = self._result_cache_key(template, text)
+                cached = self._get_cached_result(cache_key)
+                if cached is not None:
+                    results[i] = ExtractionResult(
+                        source_file="text_input",
+                        extracted_data=cached[0],
+                        confidence_scores=cached[1],
+                        processing_time=0.0,
+                        errors=[],
+                        status=ProcessingStatus.COMPLETED
+                    )
+                    continue
+                cache_keys[str(i)] = cache_key
+                documents.append(lx.data.Document(text=text, document_id=str(i)))
+
+            if not documents:
+                self.logger.info("Batch extraction answered from cache")
+                return results
+
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            annotated_documents = lx.extract(
+                text_or_documents=documents,
+                prompt_description=prompt_description,
+                examples=examples,
+                model_id=self.model_id,
+                api_key=api_key,
+                max_workers=self.max_workers,
+                max_char_buffer=self.max_char_buffer,
+                extraction_passes=self.extraction_passes,
+                batch_length=len(documents)
+            )
+
+            # Time is shared evenly by the documents of the request
+            processing_time = (time.time() - start_time) / len(documents)
+
+            for annotated in annotated_documents:
+                index = int(annotated.document_id)
+                extracted_data, confidence_scores = self._validate_extraction_result(annotated, template)
+                self._store_result(cache_keys[annotated.document_id], extracted_data, confidence_scores)
+                results[index] = ExtractionResult(
+                    source_file="text_input",
+                    extracted_data=extracted_data,
+                    confidence_scores=confidence_scores,
+                    processing_time=processing_time,
+                    errors=[],
+                    status=ProcessingStatus.COMPLETED
+                )
+
+            for i in batchable:
+                if results[i] is None:
+                    results[i] = ExtractionResult(
+                        source_file="text_input",
+                        extracted_data={},
+                        confidence_scores={},
+                        processing_time=processing_time,
+                        errors=["No extraction result returned for document"],
+                        status=ProcessingStatus.FAILED
+                    )
+
+            self.logger.info(f"Batch extraction completed in {time.time() - start_time:.2f}s")
+            return results
+
+        except OperationCancelledError:
+            self.logger.info("Batch extraction cancelled")
+            raise
+
+        except Exception as e:
+            processing_time = time.time() - start_time
+
+            if isinstance(e, (LangExtractorError, ValidationError, APIValidationError)):
+                self.logger.error(f"Batch extraction failed: {str(e)}")
+                for i in batchable:
+                    results[i] = ExtractionResult(
+                        source_file="text_input",
+                        extracted_data={},
+                        confidence_scores={},
+                        processing_time=processing_time,
+                        errors=[str(e)],
+                        status=ProcessingStatus.FAILED
+                    )
+                return results
+            else:
+                self.logger.error(f"Unexpected error during batch extraction: {str(e)}")
+                raise LangExtractorError(
+                    f"Batch extraction failed: {str(e)}",
+                    category=ErrorCategory.EXTRACTION_ERROR,
                     severity=ErrorSeverity.HIGH
                 )
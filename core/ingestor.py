@@ -28,6 +28,7 @@ from .exceptions import (
 )
 from .ocr_engine import OCREngine
 from .proofreader import Proofreader
+from .cancellation import CancelToken
 
 
 logger = logging.getLogger(__name__)
@@ -207,12 +208,13 @@ class Ingestor(ProcessorInterface):
             )
         return self._proofreader
     
-    def process(self, file_path: str) -> str:
+    def process(self, file_path: str, cancel_token: Optional[CancelToken] = None) -> str:
         """
         Process a file and extract text content.
         
         Args:
             file_path: Path to the file to process
+            cancel_token: Token checked between processing steps (optional)
             
         Returns:
             Extracted text content (with optional proofreading)
@@ -220,16 +222,20 @@ class Ingestor(ProcessorInterface):
         Raises:
             FileAccessError: If file cannot be accessed
             ValidationError: If file format is unsupported
+            OperationCancelledError: If processing was cancelled
             LangExtractorError: For other processing errors
         """
         try:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            
             file_format = self.detect_format(file_path)
             
             self.logger.info(f"Processing {file_format} file: {file_path}")
             
             # Extract raw text based on file format
             if file_format == 'pdf':
-                text = self.process_pdf(file_path)
+                text = self.process_pdf(file_path, cancel_token=cancel_token)
             elif file_format in ['docx', 'doc']:
                 text = self.process_docx(file_path)
             elif file_format in ['xlsx', 'xls']:
@@ -245,6 +251,8 @@ class Ingestor(ProcessorInterface):
             
             # Apply proofreading if enabled
             if self.proofreading_enabled and text:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
                 try:
                     proofreader = self._get_proofreader()
                     text = proofreader.proofread(text)
@@ -264,7 +272,7 @@ class Ingestor(ProcessorInterface):
                 context={'file_path': file_path, 'operation': 'file_processing'}
             )
     
-    def process_pdf(self, file_path: str) -> str:
+    def process_pdf(self, file_path: str, cancel_token: Optional[CancelToken] = None) -> str:
         """
         Extract text from PDF files using PyMuPDF and OCR fallback.
         
@@ -272,6 +280,7 @@ class Ingestor(ProcessorInterface):
         
         Args:
             file_path: Path to the PDF file
+            cancel_token: Token checked between OCR pages (optional)
             
         Returns:
             Extracted text content
@@ -284,7 +293,9 @@ class Ingestor(ProcessorInterface):
             # If OCR is enabled, use the OCR engine which handles both direct text and OCR
             if self.ocr_enabled:
                 ocr_engine = self._get_ocr_engine()
-                return ocr_engine.extract_text_from_pdf(file_path, ocr_enabled=True)
+                return ocr_engine.extract_text_from_pdf(
+                    file_path, ocr_enabled=True, cancel_token=cancel_token
+                )
             
             # Fallback to direct text extraction only
             return self._extract_text_direct_only(file_path)
@@ -90,9 +90,13 @@ class ExtractionTemplate:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractionResult:
-    """Result of data extraction from a single file."""
+    """
+    Result of data extraction from a single file.
+    
+    Immutable: use dataclasses.replace() to derive a modified result.
+    """
     source_file: str
     extracted_data: Dict[str, Any]
     confidence_scores: Dict[str, float] = field(default_factory=dict)
@@ -17,6 +17,7 @@ import fitz  # PyMuPDF
 import easyocr
 
 from .models import ProcessorInterface
+from .cancellation import CancelToken
 from .exceptions import (
     LangExtractorError,
     ErrorCategory,
@@ -151,18 +152,25 @@ class OCREngine(ProcessorInterface):
                 context={'file_path': file_path, 'operation': 'ocr_processing'}
             )
     
-    def extract_text_from_pdf(self, pdf_path: str, ocr_enabled: bool = True) -> str:
+    def extract_text_from_pdf(
+        self,
+        pdf_path: str,
+        ocr_enabled: bool = True,
+        cancel_token: Optional[CancelToken] = None
+    ) -> str:
         """
         Extract text from PDF using direct text extraction and OCR fallback.
         
         Args:
             pdf_path: Path to the PDF file
             ocr_enabled: Whether to use OCR for image-based pages (default: True)
+            cancel_token: Token checked before each page (optional)
             
         Returns:
             Extracted text content
             
         Raises:
+            OperationCancelledError: If cancelled between pages
             LangExtractorError: For PDF processing errors
         """
         try:
@@ -173,6 +181,10 @@ class OCREngine(ProcessorInterface):
             self.logger.info(f"Processing PDF: {pdf_path} ({len(doc)} pages)")
             
             for page_num in range(len(doc)):
+                if cancel_token is not None and cancel_token.is_cancelled():
+                    doc.close()
+                    cancel_token.raise_if_cancelled()
+                
                 page = doc.load_page(page_num)
                 
                 # Try direct text extraction first
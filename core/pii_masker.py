@@ -19,6 +19,9 @@ from .exceptions import LangExtractorError, ErrorCategory, ErrorSeverity
 
 logger = logging.getLogger(__name__)
 
+# Joins texts for batch masking; no masking pattern can match across it
+BATCH_SEPARATOR = '\x1e'
+
 
 @dataclass
 class MaskingPattern:
@@ -289,6 +292,40 @@ class PIIMasker:
                 details={"error": str(e)}
             ) from e
     
+    def mask_for_cloud_batch(self, texts: List[str]) -> List[str]:
+        """
+        Apply all masking rules to several texts in a single pass.
+        
+        The texts are joined with a record separator so each pattern scans
+        the whole batch once instead of once per text.
+        
+        Args:
+            texts: Original texts that may contain PII
+            
+        Returns:
+            Masked texts in input order
+            
+        Raises:
+            LangExtractorError: If masking fails due to invalid input
+        """
+        for text in texts:
+            if not isinstance(text, str):
+                raise LangExtractorError(
+                    "Invalid input type for PII masking",
+                    category=ErrorCategory.VALIDATION_ERROR,
+                    severity=ErrorSeverity.HIGH,
+                    details={"expected": "str", "received": type(text).__name__}
+                )
+        
+        if not texts or not self._enabled:
+            return list(texts)
+        
+        if any(BATCH_SEPARATOR in text for text in texts):
+            # The separator cannot be used, mask each text on its own
+            return [self.mask_for_cloud(text) for text in texts]
+        
+        return self.mask_for_cloud(BATCH_SEPARATOR.join(texts)).split(BATCH_SEPARATOR)
+    
     def enable_masking(self) -> None:
         """Enable PII masking (default state)."""
         self._enabled = True
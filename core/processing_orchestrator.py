@@ -6,24 +6,54 @@ steps and provides real-time updates to the GUI charts during processing.
 """
 
 import logging
+import os
 import time
-from typing import List, Optional, Dict, Any, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
-from threading import Thread, Event
-from PySide6.QtCore import QObject, Signal, QTimer, Slot
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Thread, Event, Lock
+from PySide6.QtCore import QObject, Signal, Slot
 
 from .models import (
     ExtractionResult, ProcessingSession, ExtractionTemplate, 
-    ProcessingStatus, FieldType
+    ProcessingStatus
 )
 from .ingestor import Ingestor
 from .extractor import Extractor
 from .aggregator import Aggregator
+from .cancellation import CancelToken
+from .exceptions import OperationCancelledError
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds for the per-file pipeline steps (seconds)
+INGESTION_TIMEOUT = 300.0
+EXTRACTION_TIMEOUT = 180.0
 
-@dataclass
+# Minimum interval between progress signals (seconds)
+PROGRESS_UPDATE_INTERVAL = 0.25
+
+# Minimum interval between file_completed signals (seconds)
+SESSION_UPDATE_INTERVAL = 0.1
+
+# Small files waiting for extraction are sent to the LLM together, up to
+# this many per request, waiting at most EXTRACT_BATCH_WAIT for more to arrive
+EXTRACT_BATCH_SIZE = 4
+EXTRACT_BATCH_WAIT = 0.05
+
+# Maximum number of ingested documents kept for reprocessing runs
+INGEST_CACHE_SIZE = 256
+
+
+def _elapsed_seconds(start_ns: int) -> float:
+    """Seconds elapsed since a time.monotonic_ns() reading."""
+    return (time.monotonic_ns() - start_ns) / 1e9
+
+
+@dataclass(slots=True)
 class ProcessingProgress:
     """Progress information for processing updates."""
     current_file: int
@@ -34,6 +64,15 @@ class ProcessingProgress:
     estimated_remaining: float
 
 
+@dataclass(frozen=True, slots=True)
+class SessionSnapshot:
+    """Immutable view of session progress delivered with file_completed."""
+    completed: int
+    total: int
+    last_result: ExtractionResult
+    results: Tuple[ExtractionResult, ...] = ()  # Completed since the previous snapshot
+
+
 class ProcessingOrchestrator(QObject):
     """
     Orchestrates the complete processing pipeline with real-time updates.
@@ -47,39 +86,78 @@ class ProcessingOrchestrator(QObject):
     
     Signals:
         progress_updated: Emitted with ProcessingProgress when progress changes
-        file_completed: Emitted with ExtractionResult when a file is processed
-        session_updated: Emitted with updated ProcessingSession
+        file_completed: Emitted with a SessionSnapshot of newly processed files (at most ~10 Hz)
+        session_updated: Emitted with the final ProcessingSession once processing ends
         processing_completed: Emitted when all processing is done
         processing_error: Emitted when an error occurs
     """
     
     progress_updated = Signal(ProcessingProgress)
-    file_completed = Signal(ExtractionResult)
+    file_completed = Signal(object)  # SessionSnapshot
     session_updated = Signal(object)  # ProcessingSession
     processing_completed = Signal(object)  # ProcessingSession
     processing_error = Signal(str)
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_workers: int = 4):
         super().__init__(parent)
         
+        # Number of files processed concurrently
+        self.max_workers = max(1, max_workers)
+        
         # Processing components
         self.ingestor = Ingestor()
         self.extractor = None  # Will be initialized when needed
         self.aggregator = None  # Will be initialized when needed
         
+        # Keep one result-caching extractor across runs (off by default)
+        self.cache_extraction_results = False
+        
         # Processing state
         self.current_session: Optional[ProcessingSession] = None
         self.is_processing = False
         self.should_cancel = Event()
+        self._cancel_token = CancelToken(self.should_cancel)
         self.processing_thread: Optional[Thread] = None
+        self.results_lock = Lock()
+        
+        # Ingested text keyed by (path, mtime_ns, size) so reruns skip OCR
+        self._ingest_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._ingest_cache_lock = Lock()
+        
+        # Long-lived worker pools for the ingestion and extraction steps
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._cpu_pool: Optional[ThreadPoolExecutor] = None
+        self._ensure_pools()
         
         # Progress tracking
-        self.start_time: Optional[float] = None
-        self.progress_timer = QTimer()
-        self.progress_timer.timeout.connect(self._emit_progress_update)
+        self.start_time: Optional[float] = None  # Wall-clock start, for display
+        self._start_ns: Optional[int] = None  # Monotonic start, for durations
+        self._last_progress_ts = 0.0
+        self._last_session_ts = 0.0
+        self._pending_results: List[ExtractionResult] = []
+        self._total_files = 0
+        self._file_names: List[str] = []
+        self._completed_count = 0
+        self._counter_lock = Lock()
         
         logger.info("ProcessingOrchestrator initialized")
     
+    def _ensure_pools(self):
+        """Create the ingestion/extraction worker pools if they are not running."""
+        if self._io_pool is None:
+            # One slot per ingestion stage worker plus one for the extractor warmup
+            self._io_pool = ThreadPoolExecutor(max_workers=self.max_workers + 1, thread_name_prefix="ingest")
+        if self._cpu_pool is None:
+            self._cpu_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="extract")
+    
+    def _shutdown_pools(self):
+        """Shut down worker pools without waiting for in-flight work."""
+        for pool in (self._io_pool, self._cpu_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool = None
+        self._cpu_pool = None
+    
     def start_processing(self, files: List[str], template: ExtractionTemplate) -> bool:
         """
         Start processing files with the given template.
@@ -97,9 +175,19 @@ class ProcessingOrchestrator(QObject):
         
         try:
             # Initialize components with template
-            self.extractor = Extractor()
+            self._ensure_pools()
+            if not (
+                self.cache_extraction_results
+                and self.extractor is not None
+                and self.extractor.cache_results
+            ):
+                self.extractor = Extractor(cache_results=self.cache_extraction_results)
             self.aggregator = Aggregator(template)
             
+            # Load credentials and compile the template while the first
+            # files are being ingested; extract() waits on the same lock
+            self._io_pool.submit(self.extractor.warmup, template)
+            
             # Create processing session
             self.current_session = ProcessingSession(
                 template=template,
@@ -113,6 +201,14 @@ class ProcessingOrchestrator(QObject):
             self.should_cancel.clear()
             self.is_processing = True
             self.start_time = time.time()
+            self._start_ns = time.monotonic_ns()
+            self._last_progress_ts = 0.0
+            self._last_session_ts = 0.0
+            self._pending_results = []
+            self._file_names = [Path(f).name for f in files]
+            with self._counter_lock:
+                self._total_files = len(files)
+                self._completed_count = 0
             
             # Start processing in background thread
             self.processing_thread = Thread(
@@ -122,14 +218,11 @@ class ProcessingOrchestrator(QObject):
             )
             self.processing_thread.start()
             
-            # Start progress timer for regular updates
-            self.progress_timer.start(1000)  # Update every second
-            
-            logger.info(f"Started processing {len(files)} files")
+            logger.info("Started processing %s files", len(files))
             return True
             
         except Exception as e:
-            logger.error(f"Failed to start processing: {e}", exc_info=True)
+            logger.error("Failed to start processing: %s", e, exc_info=True)
             self.processing_error.emit(f"Failed to start processing: {str(e)}")
             return False
     
@@ -139,58 +232,68 @@ class ProcessingOrchestrator(QObject):
             return
         
         logger.info("Cancelling processing...")
-        self.should_cancel.set()
+        self._cancel_token.cancel()
     
     def _process_files_worker(self, files: List[str], template: ExtractionTemplate):
-        """Worker method that runs in background thread."""
+        """
+        Worker method that runs in background thread.
+        
+        Files flow through a pipeline of stages connected by bounded queues:
+        ingestion workers -> extraction workers -> this thread, which acts as
+        the sink that records results and emits signals. Each stage runs
+        independently so OCR of one file overlaps the LLM call of another.
+        """
         try:
-            total_files = len(files)
+            if self.extractor is None:
+                raise RuntimeError("Extractor is not initialized")
             
-            for i, file_path in enumerate(files):
-                if self.should_cancel.is_set():
-                    logger.info("Processing cancelled by user")
-                    break
-                
-                try:
-                    # Process single file
-                    result = self._process_single_file(file_path, template)
-                    
-                    # Add to session
-                    if self.current_session:
-                        self.current_session.results.append(result)
-                    
-                    # Emit signals for real-time updates
-                    self.file_completed.emit(result)
-                    if self.current_session:
-                        self.session_updated.emit(self.current_session)
-                    
-                    logger.debug(f"Completed processing: {file_path}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {file_path}: {e}", exc_info=True)
-                    
-                    # Create error result
-                    error_result = ExtractionResult(
-                        source_file=file_path,
-                        extracted_data={},
-                        confidence_scores={},
-                        processing_time=0.0,
-                        errors=[str(e)],
-                        status=ProcessingStatus.FAILED
-                    )
-                    
-                    if self.current_session:
-                        self.current_session.results.append(error_result)
-                    
-                    self.file_completed.emit(error_result)
-                    if self.current_session:
-                        self.session_updated.emit(self.current_session)
+            ingest_workers = self.max_workers
+            extract_workers = self.max_workers
+            
+            ingest_q: Queue = Queue(maxsize=2 * ingest_workers)
+            extract_q: Queue = Queue(maxsize=2 * extract_workers)
+            results_q: Queue = Queue()
+            
+            ingest_threads = [
+                Thread(target=self._ingest_stage, args=(ingest_q, extract_q),
+                       name=f"ingest-stage-{i}", daemon=True)
+                for i in range(ingest_workers)
+            ]
+            extract_threads = [
+                Thread(target=self._extract_stage, args=(extract_q, results_q, template),
+                       name=f"extract-stage-{i}", daemon=True)
+                for i in range(extract_workers)
+            ]
+            feeder = Thread(
+                target=self._feed_stage,
+                args=(files, ingest_q, extract_q, ingest_threads, extract_workers),
+                name="feed-stage", daemon=True
+            )
+            
+            for thread in ingest_threads + extract_threads:
+                thread.start()
+            feeder.start()
+            
+            # Sink stage: drain results until every extraction worker has exited
+            finished_workers = 0
+            while finished_workers < extract_workers:
+                result = results_q.get()
+                if result is None:
+                    finished_workers += 1
+                    continue
+                self._record_result(result)
+            
+            # Deliver any results held back by session update coalescing
+            self._flush_session_update()
+            
+            if self._cancel_token.is_cancelled():
+                logger.info("Processing cancelled by user")
             
             # Processing completed
             self._finalize_processing()
             
         except Exception as e:
-            logger.error(f"Critical error in processing worker: {e}", exc_info=True)
+            logger.error("Critical error in processing worker: %s", e, exc_info=True)
             self.processing_error.emit(f"Critical processing error: {str(e)}")
         finally:
             # Clean up from the main thread safely
@@ -200,180 +303,307 @@ class ProcessingOrchestrator(QObject):
                 Qt.QueuedConnection
             )
     
+    def _feed_stage(self, files: List[str], ingest_q: Queue, extract_q: Queue,
+                    ingest_threads: List[Thread], extract_workers: int):
+        """Feed files into the pipeline and shut the stages down in order."""
+        for file_path in files:
+            # Cancellation poisons the front of the pipeline
+            if self._cancel_token.is_cancelled():
+                break
+            ingest_q.put(file_path)
+        
+        for _ in ingest_threads:
+            ingest_q.put(None)
+        for thread in ingest_threads:
+            thread.join()
+        
+        for _ in range(extract_workers):
+            extract_q.put(None)
+    
+    def _ingest_stage(self, ingest_q: Queue, extract_q: Queue):
+        """Ingestion stage: turn queued file paths into text."""
+        while True:
+            file_path = ingest_q.get()
+            if file_path is None:
+                break
+            if self._cancel_token.is_cancelled():
+                continue
+            
+            start_ns = time.monotonic_ns()
+            try:
+                extract_q.put((file_path, self._ingest_file(file_path), start_ns, None))
+            except Exception as e:
+                extract_q.put((file_path, None, start_ns, e))
+    
+    def _extract_stage(self, extract_q: Queue, results_q: Queue, template: ExtractionTemplate):
+        """Extraction stage: turn ingested text into extraction results."""
+        try:
+            finished = False
+            while not finished:
+                # Collect whatever is ready, up to one batch
+                batch = []
+                item = extract_q.get()
+                while True:
+                    if item is None:
+                        finished = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= EXTRACT_BATCH_SIZE:
+                        break
+                    try:
+                        item = extract_q.get(timeout=EXTRACT_BATCH_WAIT)
+                    except Empty:
+                        break
+                
+                results = self._extract_items(batch, template)
+                
+                # Drop the ingested text before blocking on the next batch
+                batch = item = None
+                
+                for result in results:
+                    results_q.put(result)
+        finally:
+            results_q.put(None)
+    
+    def _extract_items(self, batch: List[tuple], template: ExtractionTemplate) -> List[ExtractionResult]:
+        """Extract a batch of ingested items, sharing one LLM request where possible."""
+        results = []
+        ready = []
+        for file_path, text_content, start_ns, error in batch:
+            if error is not None:
+                results.append(self._failed_result(file_path, error, start_ns))
+            else:
+                ready.append((file_path, text_content, start_ns))
+        
+        if len(ready) == 1:
+            file_path, text_content, start_ns = ready[0]
+            results.append(self._extract_file(file_path, text_content, template, start_ns))
+        elif ready:
+            results.extend(self._extract_batch(ready, template))
+        
+        return results
+    
+    def _record_result(self, result: ExtractionResult):
+        """Add a finished result to the session and notify listeners."""
+        if self.current_session:
+            with self.results_lock:
+                self.current_session.results.append(result)
+        
+        with self._counter_lock:
+            self._completed_count += 1
+            done = self._completed_count
+        
+        self._pending_results.append(result)
+        
+        # Coalesce completions into one queued signal so the GUI is not flooded
+        now = time.monotonic()
+        is_last = done >= self._total_files
+        if is_last or now - self._last_session_ts >= SESSION_UPDATE_INTERVAL:
+            self._flush_session_update()
+        
+        # Push progress on completion, rate-limited except for the final file
+        if is_last or now - self._last_progress_ts >= PROGRESS_UPDATE_INTERVAL:
+            self._last_progress_ts = now
+            self._emit_progress_update(done)
+    
+    def _flush_session_update(self):
+        """Emit a file_completed snapshot for results not yet announced."""
+        if not self._pending_results:
+            return
+        
+        added, self._pending_results = self._pending_results, []
+        self._last_session_ts = time.monotonic()
+        
+        with self._counter_lock:
+            completed = self._completed_count
+        
+        # Listeners get an immutable snapshot, never the session being mutated here
+        self.file_completed.emit(SessionSnapshot(
+            completed=completed,
+            total=self._total_files,
+            last_result=added[-1],
+            results=tuple(added)
+        ))
+    
     @Slot()
     def _cleanup_from_main_thread(self):
         """Clean up processing state from main thread (Qt slot)."""
         self.is_processing = False
-        if self.progress_timer.isActive():
-            self.progress_timer.stop()
+        
+        # Timed-out or cancelled work must not keep the pools busy for the next run
+        if self._cancel_token.is_cancelled():
+            self._shutdown_pools()
     
-    def _process_single_file(self, file_path: str, template: ExtractionTemplate) -> ExtractionResult:
-        """Process a single file and return the extraction result."""
-        start_time = time.time()
+    def _ingest_file(self, file_path: str) -> str:
+        """Ingest a file (with OCR support) on the ingestion pool."""
+        path = Path(file_path)
+        name = path.name
         
+        cache_key = self._ingest_cache_key(path)
+        if cache_key is not None:
+            with self._ingest_cache_lock:
+                cached = self._ingest_cache.get(cache_key)
+                if cached is not None:
+                    self._ingest_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.debug("Using cached ingestion result for: %s", name)
+                return cached
+        
+        logger.info("Starting ingestion for: %s", name)
         try:
-            # Check for cancellation before starting
-            if self.should_cancel.is_set():
-                return ExtractionResult(
-                    source_file=file_path,
-                    extracted_data={},
-                    confidence_scores={},
-                    processing_time=0.0,
-                    errors=["Processing cancelled by user"],
-                    status=ProcessingStatus.CANCELLED
-                )
-            
-            # Step 1: Ingest file (with OCR support) - Add timeout
-            logger.info(f"Starting ingestion for: {file_path}")
+            # The stage thread stops waiting after the time limit even if a step
+            # hangs; the expired token then stops the task at its next check
+            cancel_token = self._cancel_token.with_timeout(INGESTION_TIMEOUT)
+            future = self._io_pool.submit(
+                self.ingestor.process, os.fspath(path), cancel_token=cancel_token
+            )
             try:
-                # Add timeout for ingestion (5 minutes max)
-                import threading
-                
-                text_content = None
-                ingestion_error = None
-                
-                def ingest_worker():
-                    nonlocal text_content, ingestion_error
-                    try:
-                        text_content = self.ingestor.process(file_path)
-                    except Exception as e:
-                        ingestion_error = e
+                text_content = future.result(timeout=INGESTION_TIMEOUT)
+            except FuturesTimeoutError:
+                future.cancel()
+                raise Exception(f"File ingestion timed out after 5 minutes: {file_path}")
+            except OperationCancelledError:
+                if self._cancel_token.is_cancelled():
+                    raise
+                raise Exception(f"File ingestion timed out after 5 minutes: {file_path}")
                 
-                # Run ingestion with timeout
-                ingest_thread = threading.Thread(target=ingest_worker, daemon=True)
-                ingest_thread.start()
-                ingest_thread.join(timeout=300.0)  # 5 minute timeout
-                
-                if ingest_thread.is_alive():
-                    raise Exception(f"File ingestion timed out after 5 minutes: {file_path}")
-                
-                if ingestion_error:
-                    raise ingestion_error
-                    
-                if not text_content or not text_content.strip():
-                    raise Exception("No text content extracted from file")
-                    
-            except Exception as e:
-                logger.error(f"Ingestion failed for {file_path}: {str(e)}")
-                raise
+            if not text_content or not text_content.strip():
+                raise Exception("No text content extracted from file")
             
+            if cache_key is not None:
+                with self._ingest_cache_lock:
+                    self._ingest_cache[cache_key] = text_content
+                    self._ingest_cache.move_to_end(cache_key)
+                    while len(self._ingest_cache) > INGEST_CACHE_SIZE:
+                        self._ingest_cache.popitem(last=False)
+            
+            return text_content
+                
+        except Exception as e:
+            logger.error("Ingestion failed for %s: %s", name, e)
+            raise
+    
+    @staticmethod
+    def _ingest_cache_key(path: Path) -> Optional[tuple]:
+        """Build the ingestion cache key, or None if the file cannot be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    
+    def _extract_file(self, file_path: str, text_content: str, template: ExtractionTemplate,
+                      start_ns: int) -> ExtractionResult:
+        """Extract data from ingested text and return the extraction result."""
+        name = Path(file_path).name
+        
+        try:
             # Check for cancellation after ingestion
-            if self.should_cancel.is_set():
+            if self._cancel_token.is_cancelled():
                 return ExtractionResult(
                     source_file=file_path,
                     extracted_data={},
                     confidence_scores={},
-                    processing_time=time.time() - start_time,
+                    processing_time=_elapsed_seconds(start_ns),
                     errors=["Processing cancelled by user"],
                     status=ProcessingStatus.CANCELLED
                 )
             
-            # Step 2: Extract data using LangExtract - Add timeout
-            logger.info(f"Starting extraction for: {file_path}")
+            # Extract data using LangExtract on the extraction pool
+            logger.info("Starting extraction for: %s", name)
             try:
-                if self.extractor:
-                    # Add timeout for extraction (3 minutes max)
-                    extracted_data = None
-                    confidence_scores = None
-                    extraction_error = None
-                    
-                    def extract_worker():
-                        nonlocal extracted_data, confidence_scores, extraction_error
-                        try:
-                            extraction_result = self.extractor.extract(text_content, template)
-                            extracted_data = extraction_result.extracted_data
-                            confidence_scores = extraction_result.confidence_scores
-                        except Exception as e:
-                            extraction_error = e
-                    
-                    # Run extraction with timeout
-                    extract_thread = threading.Thread(target=extract_worker, daemon=True)
-                    extract_thread.start()
-                    extract_thread.join(timeout=180.0)  # 3 minute timeout
-                    
-                    if extract_thread.is_alive():
-                        raise Exception(f"Data extraction timed out after 3 minutes: {file_path}")
-                    
-                    if extraction_error:
-                        raise extraction_error
-                        
-                else:
-                    # Fallback to simulation if extractor not available
-                    extracted_data = self._simulate_extraction(text_content, template)
-                    confidence_scores = self._simulate_confidence_scores(template)
+                future = self._cpu_pool.submit(
+                    self.extractor.extract, text_content, template, cancel_token=self._cancel_token
+                )
+                try:
+                    extraction_result = future.result(timeout=EXTRACTION_TIMEOUT)
+                except FuturesTimeoutError:
+                    future.cancel()
+                    raise Exception(f"Data extraction timed out after 3 minutes: {file_path}")
                     
             except Exception as e:
-                logger.error(f"Extraction failed for {file_path}: {str(e)}")
+                logger.error("Extraction failed for %s: %s", name, e)
                 raise
             
-            processing_time = time.time() - start_time
+            processing_time = _elapsed_seconds(start_ns)
             
             return ExtractionResult(
                 source_file=file_path,
-                extracted_data=extracted_data,
-                confidence_scores=confidence_scores,
+                extracted_data=extraction_result.extracted_data,
+                confidence_scores=extraction_result.confidence_scores,
                 processing_time=processing_time,
-                errors=[],
-                status=ProcessingStatus.COMPLETED
+                errors=list(extraction_result.errors),
+                status=extraction_result.status
             )
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            error_msg = str(e)
-            logger.error(f"Processing failed for {file_path}: {error_msg}")
-            
-            return ExtractionResult(
-                source_file=file_path,
-                extracted_data={},
-                confidence_scores={},
-                processing_time=processing_time,
-                errors=[error_msg],
-                status=ProcessingStatus.FAILED
-            )
-    
-    def _simulate_extraction(self, text: str, template: ExtractionTemplate) -> Dict[str, Any]:
-        """Simulate data extraction for demo purposes."""
-        # This is a simplified simulation
-        # In real implementation, this would use the actual Extractor
-        
-        import random
-        
-        extracted_data = {}
-        
-        for field in template.fields:
-            # Simulate extraction success rate
-            if random.random() > 0.3:  # 70% success rate
-                if field.type == FieldType.TEXT:
-                    extracted_data[field.name] = f"Sample {field.name}"
-                elif field.type == FieldType.NUMBER:
-                    extracted_data[field.name] = random.randint(100, 10000)
-                elif field.type == FieldType.CURRENCY:
-                    extracted_data[field.name] = random.randint(1000000, 50000000)
-                elif field.type == FieldType.DATE:
-                    extracted_data[field.name] = "2024-Q4"
-        
-        return extracted_data
+            logger.error("Processing failed for %s: %s", name, e)
+            return self._failed_result(file_path, e, start_ns)
     
-    def _simulate_confidence_scores(self, template: ExtractionTemplate) -> Dict[str, float]:
-        """Simulate confidence scores for demo purposes."""
-        import random
-        
-        confidence_scores = {}
+    def _extract_batch(self, items: List[tuple], template: ExtractionTemplate) -> List[ExtractionResult]:
+        """Extract several ingested files with a single Extractor.extract_batch call."""
+        if self._cancel_token.is_cancelled():
+            return [
+                ExtractionResult(
+                    source_file=file_path,
+                    extracted_data={},
+                    confidence_scores={},
+                    processing_time=_elapsed_seconds(start_ns),
+                    errors=["Processing cancelled by user"],
+                    status=ProcessingStatus.CANCELLED
+                )
+                for file_path, _, start_ns in items
+            ]
         
-        for field in template.fields:
-            # Simulate confidence score
-            confidence_scores[field.name] = random.uniform(0.5, 0.98)
+        logger.info("Starting batch extraction for %s files", len(items))
+        try:
+            texts = [text_content for _, text_content, _ in items]
+            future = self._cpu_pool.submit(
+                self.extractor.extract_batch, texts, template, cancel_token=self._cancel_token
+            )
+            try:
+                extraction_results = future.result(timeout=EXTRACTION_TIMEOUT)
+            except FuturesTimeoutError:
+                future.cancel()
+                raise Exception(f"Data extraction timed out after 3 minutes for {len(items)} files")
+        except Exception as e:
+            logger.error("Batch extraction failed: %s", e)
+            return [self._failed_result(file_path, e, start_ns) for file_path, _, start_ns in items]
         
-        return confidence_scores
+        return [
+            ExtractionResult(
+                source_file=file_path,
+                extracted_data=extraction_result.extracted_data,
+                confidence_scores=extraction_result.confidence_scores,
+                processing_time=_elapsed_seconds(start_ns),
+                errors=list(extraction_result.errors),
+                status=extraction_result.status
+            )
+            for (file_path, _, start_ns), extraction_result in zip(items, extraction_results)
+        ]
+    
+    def _failed_result(self, file_path: str, error: Exception, start_ns: int) -> ExtractionResult:
+        """Build the result recorded for a file that failed or was cancelled in any stage."""
+        cancelled = isinstance(error, OperationCancelledError)
+        return ExtractionResult(
+            source_file=file_path,
+            extracted_data={},
+            confidence_scores={},
+            processing_time=_elapsed_seconds(start_ns),
+            errors=[str(error)],
+            status=ProcessingStatus.CANCELLED if cancelled else ProcessingStatus.FAILED
+        )
     
-    def _emit_progress_update(self):
+    def _emit_progress_update(self, completed_files: Optional[int] = None):
         """Emit progress update signal."""
-        if not self.current_session or not self.start_time:
+        if not self.current_session or self._start_ns is None:
             return
         
-        total_files = len(self.current_session.files)
-        completed_files = len(self.current_session.results)
-        elapsed_time = time.time() - self.start_time
+        total_files = self._total_files
+        if completed_files is None:
+            with self._counter_lock:
+                completed_files = self._completed_count
+        elapsed_time = _elapsed_seconds(self._start_ns)
         
         # Estimate remaining time
         if completed_files > 0:
@@ -386,7 +616,7 @@ class ProcessingOrchestrator(QObject):
         # Current file info
         current_file_name = ""
         if completed_files < total_files:
-            current_file_name = self.current_session.files[completed_files]
+            current_file_name = self._file_names[completed_files]
         
         progress = ProcessingProgress(
             current_file=completed_files,
@@ -408,10 +638,11 @@ class ProcessingOrchestrator(QObject):
                     summary_stats = self.aggregator.aggregate_results(self.current_session.results)
                     self.current_session.summary_stats = summary_stats
                 except Exception as e:
-                    logger.error(f"Error calculating summary stats: {e}")
+                    logger.error("Error calculating summary stats: %s", e)
             
+            self.session_updated.emit(self.current_session)
             self.processing_completed.emit(self.current_session)
-            logger.info(f"Processing completed: {len(self.current_session.results)} files processed")
+            logger.info("Processing completed: %s files processed", len(self.current_session.results))
     
     def get_current_session(self) -> Optional[ProcessingSession]:
         """Get the current processing session."""
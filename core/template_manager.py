@@ -3,8 +3,11 @@ Template management system for saving/loading extraction templates.
 """
 
 import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from core.models import ExtractionTemplate, TemplateManagerInterface
 from core.exceptions import ConfigurationError, ValidationError
 from core.utils import get_templates_dir, sanitize_filename, safe_json_load, safe_json_save
@@ -16,11 +19,18 @@ class TemplateManager(TemplateManagerInterface):
     
     Handles saving, loading, listing, and deleting extraction templates
     with validation and error handling for corrupted templates.
+    Parsed template metadata is cached and re-read only when the
+    file's modification time or size changes.
     """
     
+    # Maximum number of parsed template files kept in memory
+    TEMPLATE_CACHE_SIZE = 256
+    
     def __init__(self):
         """Initialize template manager."""
         self._templates_dir = get_templates_dir()
+        self._cache: "OrderedDict[Path, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def save_template(self, template: ExtractionTemplate) -> bool:
         """
@@ -60,6 +70,7 @@ class TemplateManager(TemplateManagerInterface):
         try:
             template_data = template.to_dict()
             safe_json_save(template_data, template_file)
+            self._invalidate(template_file)
             return True
         except Exception as e:
             raise ConfigurationError(
@@ -91,6 +102,8 @@ class TemplateManager(TemplateManagerInterface):
             return None
         
         try:
+            # Loaded templates are edited in place, so they are parsed fresh
+            # rather than built from the cached metadata
             template_data = safe_json_load(template_file)
             template = ExtractionTemplate.from_dict(template_data)
             
@@ -115,15 +128,50 @@ class TemplateManager(TemplateManagerInterface):
         template_names = []
         
         try:
-            for template_file in self._templates_dir.glob("*.json"):
-                # Extract name from filename (remove .json extension)
-                name = template_file.stem
-                template_names.append(name)
+            with os.scandir(self._templates_dir) as entries:
+                for entry in entries:
+                    # Extract name from filename (remove .json extension)
+                    if entry.name.endswith(".json") and entry.is_file():
+                        template_names.append(entry.name[:-5])
         except OSError:
             # Return empty list if directory cannot be read
             pass
         
-        return sorted(template_names)
+        template_names.sort()
+        return template_names
+    
+    def list_template_infos(self) -> List[Dict[str, Any]]:
+        """
+        List available templates with their file size and modification time.
+        
+        Uses a single directory scan instead of a lookup per template name;
+        template contents are not read.
+        
+        Returns:
+            List of dictionaries with 'name', 'file_size' and 'modified_time',
+            sorted by name
+        """
+        template_infos = []
+        
+        try:
+            with os.scandir(self._templates_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json") or not entry.is_file():
+                        continue
+                    
+                    # DirEntry caches its stat result
+                    file_stat = entry.stat()
+                    template_infos.append({
+                        'name': entry.name[:-5],
+                        'file_size': file_stat.st_size,
+                        'modified_time': file_stat.st_mtime
+                    })
+        except OSError:
+            # Return empty list if directory cannot be read
+            pass
+        
+        template_infos.sort(key=lambda info: info['name'])
+        return template_infos
     
     def delete_template(self, name: str) -> bool:
         """
@@ -149,6 +197,7 @@ class TemplateManager(TemplateManagerInterface):
         
         try:
             template_file.unlink()
+            self._invalidate(template_file)
             return True
         except OSError as e:
             raise ConfigurationError(
@@ -190,17 +239,14 @@ class TemplateManager(TemplateManagerInterface):
         safe_name = sanitize_filename(name)
         template_file = self._templates_dir / f"{safe_name}.json"
         
-        if not template_file.exists():
-            return None
-        
         try:
-            template_data = safe_json_load(template_file)
+            template_data, file_stat = self._read_cached(template_file)
             return {
                 'name': template_data.get('name', name),
                 'description': template_data.get('prompt_description', ''),
                 'field_count': len(template_data.get('fields', [])),
-                'file_size': template_file.stat().st_size,
-                'modified_time': template_file.stat().st_mtime
+                'file_size': file_stat.st_size,
+                'modified_time': file_stat.st_mtime
             }
         except Exception:
             return None
@@ -245,17 +291,48 @@ class TemplateManager(TemplateManagerInterface):
             )
         
         # Create new template with updated name
-        new_template = ExtractionTemplate(
-            name=new_name,
-            prompt_description=source_template.prompt_description,
-            fields=source_template.fields.copy(),
-            examples=source_template.examples.copy(),
-            provider=source_template.provider.copy(),
-            run_options=source_template.run_options.copy()
-        )
+        template_data = source_template.to_dict()
+        template_data['name'] = new_name
+        new_template = ExtractionTemplate.from_dict(template_data)
         
         return self.save_template(new_template)
     
+    def _read_cached(self, template_file: Path) -> Tuple[Dict[str, Any], os.stat_result]:
+        """
+        Read template JSON, reusing the parsed data while the file is unchanged.
+        
+        Args:
+            template_file: Path to the template JSON file
+            
+        Returns:
+            Tuple of (parsed template data, file stat result)
+            
+        Raises:
+            FileNotFoundError: If the template file does not exist
+        """
+        file_stat = template_file.stat()
+        
+        with self._cache_lock:
+            entry = self._cache.get(template_file)
+            if entry and entry[0] == file_stat.st_mtime_ns and entry[1] == file_stat.st_size:
+                self._cache.move_to_end(template_file)
+                return entry[2], file_stat
+        
+        template_data = safe_json_load(template_file)
+        
+        with self._cache_lock:
+            self._cache[template_file] = (file_stat.st_mtime_ns, file_stat.st_size, template_data)
+            self._cache.move_to_end(template_file)
+            while len(self._cache) > self.TEMPLATE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        
+        return template_data, file_stat
+    
+    def _invalidate(self, template_file: Path) -> None:
+        """Drop cached data for a template file that was written or removed."""
+        with self._cache_lock:
+            self._cache.pop(template_file, None)
+    
     def _validate_template(self, template: ExtractionTemplate) -> None:
         """
         Validate template structure and content.
@@ -287,16 +364,8 @@ class TemplateManager(TemplateManagerInterface):
                 field_value=template.fields
             )
         
-        # Validate field names are unique
-        field_names = [field.name for field in template.fields]
-        if len(field_names) != len(set(field_names)):
-            raise ValidationError(
-                message="Template field names must be unique",
-                field_name="template.fields",
-                field_value=field_names
-            )
-        
-        # Validate each field
+        # Validate each field and field name uniqueness in a single pass
+        seen_names = set()
         for i, field in enumerate(template.fields):
             if not isinstance(field.name, str) or not field.name.strip():
                 raise ValidationError(
@@ -305,6 +374,14 @@ class TemplateManager(TemplateManagerInterface):
                     field_value=field.name
                 )
             
+            if field.name in seen_names:
+                raise ValidationError(
+                    message="Template field names must be unique",
+                    field_name="template.fields",
+                    field_value=[f.name for f in template.fields]
+                )
+            seen_names.add(field.name)
+            
             if not isinstance(field.description, str):
                 raise ValidationError(
                     message=f"Field {i+1} description must be a string",
@@ -3,25 +3,99 @@ Utility functions for the automated report extraction system.
 """
 
 import os
+import re
 import json
+import functools
+import dataclasses
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple
 from core.exceptions import ConfigurationError, ValidationError
 from core.models import AppConfig
 
+# Optional faster JSON libraries, preferred in this order over the stdlib module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+
+# Directories already created by ensure_directory_exists in this process
+_known_directories: Set[str] = set()
+
+# Last loaded configuration, keyed by (path, mtime_ns, size) of the file it came from
+_config_cache: Optional[Tuple[Tuple[str, int, int], AppConfig]] = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes with the fastest decoder available (orjson, ujson, json)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if UJSON_AVAILABLE:
+        return ujson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(data: Any, pretty: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, using orjson when available.
+    
+    Pretty output is indented by 2 spaces; otherwise it has no whitespace.
+    ujson is not used for writing: it escapes '/' and formats indentation
+    differently, so saved files would change depending on what is installed.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=32)
+def _create_dir_once(directory: Path) -> Path:
+    """Create an application directory on first use; later calls skip the mkdir."""
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _write_bytes_atomic(file_path: Path, payload: bytes) -> None:
+    """
+    Replace a file's contents so readers see either the old or the new file.
+    
+    The payload goes to a temporary sibling that is renamed over the target,
+    so a crash mid-write never leaves a truncated file behind.
+    """
+    temp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        try:
+            temp_path.write_bytes(payload)
+        except FileNotFoundError:
+            # The directory was removed after it was created, create it again
+            _known_directories.discard(str(file_path.parent))
+            ensure_directory_exists(file_path.parent)
+            temp_path.write_bytes(payload)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
 
 def get_app_data_dir() -> Path:
     """Get the application data directory."""
-    app_data = Path.home() / 'AppData' / 'Local' / 'LangExtractor'
-    app_data.mkdir(parents=True, exist_ok=True)
-    return app_data
+    return _create_dir_once(Path.home() / 'AppData' / 'Local' / 'LangExtractor')
 
 
 def get_templates_dir() -> Path:
     """Get the templates directory."""
-    templates_dir = get_app_data_dir() / 'templates'
-    templates_dir.mkdir(parents=True, exist_ok=True)
-    return templates_dir
+    return _create_dir_once(get_app_data_dir() / 'templates')
 
 
 def get_config_file() -> Path:
@@ -33,48 +107,90 @@ def load_config() -> AppConfig:
     """
     Load application configuration from file.
     
+    The parsed configuration is reused until the file changes on disk.
+    
     Returns:
         AppConfig instance with loaded or default settings
     """
+    global _config_cache
     config_file = get_config_file()
     
-    if not config_file.exists():
+    cache_key = _config_cache_key(config_file)
+    if cache_key is None:
         # Return default configuration
         return AppConfig()
     
+    cached = _config_cache
+    if cached is not None and cached[0] == cache_key:
+        return _copy_config(cached[1])
+    
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-        return AppConfig.from_dict(config_data)
+        config_data = _json_loads(config_file.read_bytes())
+        config = AppConfig.from_dict(config_data)
     except (json.JSONDecodeError, KeyError, ValueError) as e:
         raise ConfigurationError(
             message=f"Failed to load configuration: {str(e)}",
             config_key="config.json",
             original_error=e
         )
+    
+    _config_cache = (cache_key, config)
+    return _copy_config(config)
+
+
+def _copy_config(config: AppConfig) -> AppConfig:
+    """Copy a cached configuration so callers can modify it freely."""
+    return dataclasses.replace(config, ocr_languages=list(config.ocr_languages))
+
+
+def invalidate_config_cache() -> None:
+    """Forget the cached configuration so the next load_config() reads the file."""
+    global _config_cache
+    _config_cache = None
 
 
 def save_config(config: AppConfig) -> None:
     """
     Save application configuration to file.
     
+    Saving a configuration identical to the unchanged file on disk is a no-op.
+    
     Args:
         config: AppConfig instance to save
     """
+    global _config_cache
     config_file = get_config_file()
     
+    if _config_cache is not None and _config_cache[1] == config:
+        if _config_cache[0] == _config_cache_key(config_file):
+            return
+    
     try:
         # Ensure parent directory exists
         ensure_directory_exists(config_file.parent)
         
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+        invalidate_config_cache()
+        _write_bytes_atomic(config_file, _json_dumps(config.to_dict()))
     except (OSError, TypeError) as e:
         raise ConfigurationError(
             message=f"Failed to save configuration: {str(e)}",
             config_key="config.json",
             original_error=e
         )
+    
+    # What was just written is what the next load_config() would parse
+    cache_key = _config_cache_key(config_file)
+    if cache_key is not None:
+        _config_cache = (cache_key, _copy_config(config))
+
+
+def _config_cache_key(config_file: Path) -> Optional[Tuple[str, int, int]]:
+    """Build the (path, mtime_ns, size) cache key for the config file, None if missing."""
+    try:
+        file_stat = config_file.stat()
+    except OSError:
+        return None
+    return str(config_file), file_stat.st_mtime_ns, file_stat.st_size
 
 
 # Aliases for compatibility
@@ -82,13 +198,20 @@ load_app_config = load_config
 save_app_config = save_config
 
 
-def validate_file_path(file_path: str, must_exist: bool = True) -> Path:
+def validate_file_path(
+    file_path: str,
+    must_exist: bool = True,
+    *,
+    stat_cache: Optional[Dict[str, os.stat_result]] = None
+) -> Path:
     """
     Validate and convert file path to Path object.
     
     Args:
         file_path: File path string
         must_exist: Whether the file must exist
+        stat_cache: Stat results shared across calls when validating many
+            paths, filled in for paths not seen before (optional)
         
     Returns:
         Validated Path object
@@ -103,16 +226,44 @@ def validate_file_path(file_path: str, must_exist: bool = True) -> Path:
             field_value=file_path
         )
     
-    path = Path(file_path)
-    
-    if must_exist and not path.exists():
+    if must_exist and not _path_exists(file_path, stat_cache):
         raise ValidationError(
             message=f"File does not exist: {file_path}",
             field_name="file_path",
             field_value=file_path
         )
     
-    return path
+    return Path(file_path)
+
+
+# Supported file extensions by category, and the reverse lookup used by detect_file_type
+_SUPPORTED_EXTENSIONS = {
+    'pdf': ('.pdf',),
+    'docx': ('.docx', '.doc'),
+    'excel': ('.xlsx', '.xls'),
+    'csv': ('.csv',),
+    'text': ('.txt',)
+}
+_EXTENSION_TYPES = {
+    extension: file_type
+    for file_type, extensions in _SUPPORTED_EXTENSIONS.items()
+    for extension in extensions
+}
+
+
+def _path_exists(file_path: str, stat_cache: Optional[Dict[str, os.stat_result]]) -> bool:
+    """Check that a path exists, consulting and filling stat_cache when given."""
+    if stat_cache is None:
+        return os.path.exists(file_path)
+    
+    if file_path in stat_cache:
+        return True
+    
+    try:
+        stat_cache[file_path] = os.stat(file_path)
+    except (OSError, ValueError):
+        return False
+    return True
 
 
 def get_supported_file_extensions() -> Dict[str, List[str]]:
@@ -122,13 +273,7 @@ def get_supported_file_extensions() -> Dict[str, List[str]]:
     Returns:
         Dictionary mapping categories to file extensions
     """
-    return {
-        'pdf': ['.pdf'],
-        'docx': ['.docx', '.doc'],
-        'excel': ['.xlsx', '.xls'],
-        'csv': ['.csv'],
-        'text': ['.txt']
-    }
+    return {file_type: list(extensions) for file_type, extensions in _SUPPORTED_EXTENSIONS.items()}
 
 
 def detect_file_type(file_path: str) -> Optional[str]:
@@ -141,16 +286,7 @@ def detect_file_type(file_path: str) -> Optional[str]:
     Returns:
         File type category or None if unsupported
     """
-    path = Path(file_path)
-    extension = path.suffix.lower()
-    
-    supported_extensions = get_supported_file_extensions()
-    
-    for file_type, extensions in supported_extensions.items():
-        if extension in extensions:
-            return file_type
-    
-    return None
+    return _EXTENSION_TYPES.get(os.path.splitext(file_path)[1].lower())
 
 
 def is_supported_file(file_path: str) -> bool:
@@ -166,20 +302,27 @@ def is_supported_file(file_path: str) -> bool:
     return detect_file_type(file_path) is not None
 
 
+# Characters not allowed in Windows filenames, each replaced by an underscore
+_FILENAME_INVALID_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_FILENAME_INVALID_RE = re.compile(r'[<>:"/\\|?*]')
+
+
+@functools.lru_cache(maxsize=512)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe file system operations.
     
+    Results are memoized since template names are looked up repeatedly.
+    
     Args:
         filename: Original filename
         
     Returns:
         Sanitized filename
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Remove or replace invalid characters; most names have none, so skip the copy
+    if _FILENAME_INVALID_RE.search(filename):
+        filename = filename.translate(_FILENAME_INVALID_CHARS)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
@@ -195,6 +338,9 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -208,15 +354,12 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
     i = 0
-    size = float(size_bytes)
-    
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
+    if size_bytes >= 1024:
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
     
-    return f"{size:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
 
 
 def ensure_directory_exists(directory: Path) -> None:
@@ -229,8 +372,13 @@ def ensure_directory_exists(directory: Path) -> None:
     Raises:
         ConfigurationError: If directory cannot be created
     """
+    directory_key = str(directory)
+    if directory_key in _known_directories:
+        return
+    
     try:
         directory.mkdir(parents=True, exist_ok=True)
+        _known_directories.add(directory_key)
     except OSError as e:
         raise ConfigurationError(
             message=f"Failed to create directory: {directory}",
@@ -253,9 +401,8 @@ def safe_json_load(file_path: Path) -> Dict[str, Any]:
         ConfigurationError: If file cannot be loaded
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
+        return _json_loads(file_path.read_bytes())
+    except (OSError, ValueError) as e:
         raise ConfigurationError(
             message=f"Failed to load JSON file: {file_path}",
             config_key=str(file_path),
@@ -263,13 +410,15 @@ def safe_json_load(file_path: Path) -> Dict[str, Any]:
         )
 
 
-def safe_json_save(data: Dict[str, Any], file_path: Path) -> None:
+def safe_json_save(data: Dict[str, Any], file_path: Path, *, pretty: bool = False) -> None:
     """
     Safely save data to JSON file with error handling.
     
     Args:
         data: Data to save
         file_path: Path to JSON file
+        pretty: Indent the output for files meant to be edited by hand
+            (default: False, compact output)
         
     Raises:
         ConfigurationError: If file cannot be saved
@@ -278,9 +427,8 @@ def safe_json_save(data: Dict[str, Any], file_path: Path) -> None:
         # Ensure parent directory exists
         ensure_directory_exists(file_path.parent)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    except (OSError, json.JSONEncodeError) as e:
+        _write_bytes_atomic(file_path, _json_dumps(data, pretty=pretty))
+    except (OSError, TypeError, ValueError) as e:
         raise ConfigurationError(
             message=f"Failed to save JSON file: {file_path}",
             config_key=str(file_path),
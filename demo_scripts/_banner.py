@@ -0,0 +1,88 @@
+"""
+Shared info banner for the demo windows.
+
+Each demo supplies its own stylesheet and text; the banner widget tree and the
+object names the stylesheets select on are built here. Demos that still style
+their headers in code share the cached title fonts.
+"""
+
+import functools
+import html
+from typing import Callable, Optional, Sequence
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+
+@functools.cache
+def title_font(point_size: int) -> QFont:
+    """Bold title font, built once per size; QFont is implicitly shared."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
+
+def build_demo_banner(
+    qss: str,
+    text_html: str,
+    steps: Sequence[str],
+    reload_text: str,
+    on_reload: Optional[Callable[[], None]] = None,
+    step_style: str = ""
+) -> QWidget:
+    """
+    Build a demo info banner.
+    
+    The banner is styled by a single stylesheet that can target the object
+    names ``demoBanner``, ``demoText``, ``demoSteps`` and ``reloadBtn``. The
+    workflow steps share one rich-text label rather than a label each.
+    
+    Args:
+        qss: Stylesheet applied once to the banner
+        text_html: Rich text for the banner title and description
+        steps: Captions of the workflow steps
+        reload_text: Caption of the reload button
+        on_reload: Slot connected to the reload button
+        step_style: Inline CSS applied to each step caption
+        
+    Returns:
+        The banner widget
+    """
+    demo_banner = QWidget()
+    demo_banner.setObjectName("demoBanner")
+    demo_banner.setStyleSheet(qss)
+    
+    banner_layout = QVBoxLayout(demo_banner)
+    
+    # Title and description
+    banner_text = QLabel(text_html)
+    banner_text.setObjectName("demoText")
+    banner_text.setTextFormat(Qt.RichText)
+    banner_text.setWordWrap(True)
+    banner_layout.addWidget(banner_text)
+    
+    # Workflow steps
+    steps_layout = QHBoxLayout()
+    
+    steps_label = QLabel("&nbsp;&nbsp;".join(
+        f"<span style='{step_style}'>&nbsp;{html.escape(step)}&nbsp;</span>"
+        for step in steps
+    ))
+    steps_label.setObjectName("demoSteps")
+    steps_label.setTextFormat(Qt.RichText)
+    steps_layout.addWidget(steps_label)
+    
+    steps_layout.addStretch()
+    
+    # Demo controls
+    reload_btn = QPushButton(reload_text)
+    reload_btn.setObjectName("reloadBtn")
+    if on_reload is not None:
+        reload_btn.clicked.connect(on_reload)
+    steps_layout.addWidget(reload_btn)
+    
+    banner_layout.addLayout(steps_layout)
+    
+    return demo_banner
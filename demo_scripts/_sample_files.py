@@ -0,0 +1,93 @@
+"""
+Shared sample reports for the demo scripts.
+
+The reports are stored as UTF-8 text files in the ``samples`` directory next to
+this module. Demos copy them into a temporary directory on demand, so importing
+a demo never builds the sample text.
+"""
+
+import functools
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+# (size, mtime_ns) of each sample copy as last written or verified
+_written_stats: Dict[Path, Tuple[int, int]] = {}
+
+
+@functools.cache
+def _sample_blobs(prefix: str) -> Tuple[Tuple[str, bytes], ...]:
+    """Read the bundled sample reports named ``{prefix}_N.txt`` once per process."""
+    return tuple(
+        (path.name, path.read_bytes())
+        for path in sorted(SAMPLES_DIR.glob(f"{prefix}_*.txt"))
+    )
+
+
+@functools.cache
+def _sample_dir(dir_name: str) -> Path:
+    """Resolve and create a temporary sample directory once per process."""
+    temp_dir = Path(tempfile.gettempdir()) / dir_name
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir
+
+
+def _is_up_to_date(file_path: Path, payload: bytes) -> bool:
+    """Check whether a copied sample still holds exactly ``payload``."""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return False
+    
+    if stat.st_size != len(payload):
+        return False
+    if _written_stats.get(file_path) == (stat.st_size, stat.st_mtime_ns):
+        return True
+    
+    # Same size but touched since we wrote it: compare the content
+    try:
+        matches = file_path.read_bytes() == payload
+    except OSError:
+        return False
+    if matches:
+        _written_stats[file_path] = (stat.st_size, stat.st_mtime_ns)
+    return matches
+
+
+def _record_stat(file_path: Path) -> None:
+    """Remember the stat of a sample we just wrote."""
+    stat = file_path.stat()
+    _written_stats[file_path] = (stat.st_size, stat.st_mtime_ns)
+
+
+def materialize_samples(prefix: str, dir_name: str) -> List[str]:
+    """
+    Copy the bundled sample reports into a temporary directory.
+    
+    Args:
+        prefix: File name prefix of the sample reports to copy
+        dir_name: Name of the directory to create under the system temp dir
+    
+    Returns:
+        Paths of the copied sample files
+    """
+    temp_dir = _sample_dir(dir_name)
+    
+    file_paths = []
+    for name, payload in _sample_blobs(prefix):
+        file_path = temp_dir / name
+        
+        # Reloading only rewrites files that are missing or were changed
+        if not _is_up_to_date(file_path, payload):
+            try:
+                file_path.write_bytes(payload)
+            except FileNotFoundError:
+                # The directory was removed since it was first created
+                temp_dir.mkdir(exist_ok=True)
+                file_path.write_bytes(payload)
+            _record_stat(file_path)
+        file_paths.append(str(file_path))
+    
+    return file_paths
@@ -16,16 +16,56 @@ Giờ đây ứng dụng hoạt động 100% trên GUI!
 import sys
 import os
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
-from gui.simple_main_window import SimpleMainWindow
+
+# Console banner printed on startup, written in a single call
+_STARTUP_BANNER = """\
+🚀 LangExtractor Complete với Settings Started!
+
+🎯 Workflow hoàn chỉnh:
+  1️⃣ Mở Settings (Tools → Cài đặt hoặc Ctrl+,)
+     • Tab 'API Key': Nhập API key Gemini
+     • Tab 'OCR': Cài đặt ngôn ngữ và chất lượng
+     • Tab 'Privacy': Cấu hình PII masking, offline mode
+  2️⃣ Import files (drag-drop hoặc 'Thêm file')
+  3️⃣ Cấu hình Schema ('Cấu hình Schema' - tên tiếng Việt OK)
+  4️⃣ Xử lý files ('Bắt đầu xử lý' - tự động check API key)
+  5️⃣ Xem preview trong 2 tab
+  6️⃣ Xuất Excel ('Xuất Excel')
+
+✨ Tính năng mới:
+  🔑 API Key Management: Lưu an toàn vào Windows Credential Manager
+  🧪 API Key Testing: Test API key trước khi lưu
+  ⚙️ OCR Settings: Cấu hình ngôn ngữ và chất lượng OCR
+  🔒 Privacy Controls: PII masking và offline mode
+  ✅ Validation: Tự động check API key trước khi xử lý
+
+🎉 GUI hoàn chỉnh 100% - không cần terminal commands!
+
+📋 Hướng dẫn chi tiết:
+  • Bắt đầu bằng mở Settings để setup API key
+  • Lấy API key miễn phí tại: https://aistudio.google.com/app/apikey
+  • Test API key trước khi lưu để đảm bảo hoạt động
+  • Thử offline mode nếu không muốn dùng AI cloud
+  • Schema Editor support tên tiếng Việt như 'tên công ty', 'doanh thu'
+  • Ứng dụng sẽ tự động nhắc nhở nếu thiếu API key
+"""
 
 
 def main():
     """Chạy ứng dụng hoàn chỉnh với Settings."""
+    from PySide6.QtWidgets import QApplication
+    from gui.simple_main_window import SimpleMainWindow
+    
+    # --quiet skips the startup banner and is not passed on to Qt
+    verbose = "--quiet" not in sys.argv
+    sys.argv[:] = [arg for arg in sys.argv if arg != "--quiet"]
+    
     app = QApplication(sys.argv)
     
     # Set app properties
@@ -36,31 +76,9 @@ def main():
     window = SimpleMainWindow()
     window.show()
     
-    print("🚀 LangExtractor Complete với Settings Started!")
-    print("\n🎯 Workflow hoàn chỉnh:")
-    print("  1️⃣ Mở Settings (Tools → Cài đặt hoặc Ctrl+,)")
-    print("     • Tab 'API Key': Nhập API key Gemini")
-    print("     • Tab 'OCR': Cài đặt ngôn ngữ và chất lượng")
-    print("     • Tab 'Privacy': Cấu hình PII masking, offline mode")
-    print("  2️⃣ Import files (drag-drop hoặc 'Thêm file')")
-    print("  3️⃣ Cấu hình Schema ('Cấu hình Schema' - tên tiếng Việt OK)")
-    print("  4️⃣ Xử lý files ('Bắt đầu xử lý' - tự động check API key)")
-    print("  5️⃣ Xem preview trong 2 tab")
-    print("  6️⃣ Xuất Excel ('Xuất Excel')")
-    print("\n✨ Tính năng mới:")
-    print("  🔑 API Key Management: Lưu an toàn vào Windows Credential Manager")
-    print("  🧪 API Key Testing: Test API key trước khi lưu")
-    print("  ⚙️ OCR Settings: Cấu hình ngôn ngữ và chất lượng OCR")
-    print("  🔒 Privacy Controls: PII masking và offline mode")
-    print("  ✅ Validation: Tự động check API key trước khi xử lý")
-    print("\n🎉 GUI hoàn chỉnh 100% - không cần terminal commands!")
-    print("\n📋 Hướng dẫn chi tiết:")
-    print("  • Bắt đầu bằng mở Settings để setup API key")
-    print("  • Lấy API key miễn phí tại: https://aistudio.google.com/app/apikey")
-    print("  • Test API key trước khi lưu để đảm bảo hoạt động")
-    print("  • Thử offline mode nếu không muốn dùng AI cloud")
-    print("  • Schema Editor support tên tiếng Việt như 'tên công ty', 'doanh thu'")
-    print("  • Ứng dụng sẽ tự động nhắc nhở nếu thiếu API key")
+    if verbose:
+        sys.stdout.write(_STARTUP_BANNER)
+        sys.stdout.flush()
     
     return app.exec()
 
@@ -128,14 +128,16 @@ def demo_template_management():
     )
     print(f"   Template duplicated: {success}")
     
-    # List templates again
+    # List templates again, with file details from a single directory scan
     print("\n7. Listing templates after duplication...")
-    templates = template_manager.list_templates()
-    print(f"   Available templates: {templates}")
+    template_infos = template_manager.list_template_infos()
+    for template_info in template_infos:
+        print(f"   {template_info['name']} ({template_info['file_size']} bytes)")
     
     # Clean up - delete templates
     print("\n8. Cleaning up templates...")
-    for template_name in templates:
+    for template_info in template_infos:
+        template_name = template_info['name']
         success = template_manager.delete_template(template_name)
         print(f"   Deleted '{template_name}': {success}")
 
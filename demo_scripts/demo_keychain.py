@@ -7,8 +7,10 @@ This script shows how to use the KeychainManager for secure credential storage.
 import sys
 import os
 
-# Add the current directory to Python path so we can import core modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add project root to Python path so we can import core modules
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from core.keychain import KeychainManager
 from core.exceptions import CredentialError
@@ -17,14 +17,16 @@ import os
 from pathlib import Path
 from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QHBoxLayout, QPushButton, QLabel
 from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QFont
 import numpy as np
 import time
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from gui.enhanced_preview_panel import EnhancedPreviewPanel
+from demo_scripts._banner import title_font
 from core.models import (
     ExtractionResult, ProcessingSession, ExtractionTemplate, ExtractionField,
     ProcessingStatus, FieldType
@@ -247,10 +249,7 @@ class Phase3DemoWindow(QMainWindow):
         
         # Title
         title_label = QLabel("🚀 Phase 3: Advanced Charts & Analytics Dashboard")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(title_font(16))
         title_label.setStyleSheet("color: #111827; margin-bottom: 8px;")
         header_layout.addWidget(title_label)
         
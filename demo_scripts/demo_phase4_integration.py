@@ -16,13 +16,15 @@ import os
 from pathlib import Path
 from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget, QHBoxLayout, QPushButton, QLabel, QFileDialog
 from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QFont
 import tempfile
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from gui.main_window import MainWindow
+from demo_scripts._banner import title_font
 
 
 def create_sample_files():
@@ -159,10 +161,7 @@ class Phase4DemoWindow(MainWindow):
         
         # Title
         title_label = QLabel("🚀 Phase 4: Real-time Processing Integration Demo")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(title_font(14))
         title_label.setStyleSheet("color: #1E40AF; margin-bottom: 4px;")
         banner_layout.addWidget(title_label)
         
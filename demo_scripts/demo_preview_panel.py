@@ -13,22 +13,25 @@ Run this script to see the PreviewPanel in action.
 
 import sys
 import os
+import functools
 from pathlib import Path
-from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
-from PySide6.QtCore import QTimer
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
-from gui.preview_panel import PreviewPanel
-from core.models import (
-    ExtractionResult, ProcessingSession, ExtractionTemplate, ExtractionField,
-    ProcessingStatus, FieldType
-)
+# Qt and the GUI package are imported when the demo runs, so importing this
+# module stays cheap
 
 
+@functools.cache
 def create_sample_data():
-    """Create sample data for demonstration."""
+    """Create sample data for demonstration, built once per process."""
+    from core.models import (
+        ExtractionResult, ProcessingSession, ExtractionTemplate, ExtractionField,
+        ProcessingStatus, FieldType
+    )
     
     # Sample extraction results
     results = [
@@ -120,90 +123,98 @@ def create_sample_data():
     return results, template_fields, session
 
 
-class PreviewPanelDemo(QMainWindow):
-    """Demo window showcasing PreviewPanel functionality."""
+def create_demo_window():
+    """Create the demo window showcasing PreviewPanel functionality."""
+    from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget
+    from PySide6.QtCore import QTimer
+    from gui.preview_panel import PreviewPanel
     
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("PreviewPanel Demo - LangExtractor")
-        self.setMinimumSize(900, 700)
-        self.resize(1200, 800)
-        
-        # Create central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # Layout
-        layout = QVBoxLayout(central_widget)
-        layout.setContentsMargins(16, 16, 16, 16)
-        
-        # Create preview panel
-        self.preview_panel = PreviewPanel()
-        layout.addWidget(self.preview_panel)
-        
-        # Load sample data
-        self.results, self.template_fields, self.session = create_sample_data()
-        
-        # Setup demo timer to cycle through different views
-        self.demo_timer = QTimer()
-        self.demo_timer.timeout.connect(self.cycle_demo)
-        self.demo_step = 0
-        
-        # Start demo
-        self.start_demo()
-    
-    def start_demo(self):
-        """Start the automated demo."""
-        print("🎬 Starting PreviewPanel Demo")
-        print("📋 Features demonstrated:")
-        print("   • File preview with extraction results")
-        print("   • Confidence indicators with color coding")
-        print("   • Data quality visualization")
-        print("   • Summary statistics")
-        print("   • Error handling display")
-        print("   • Modern, professional UI design")
-        print()
-        
-        # Show initial view
-        self.cycle_demo()
+    class PreviewPanelDemo(QMainWindow):
+        """Demo window showcasing PreviewPanel functionality."""
         
-        # Start timer for automatic cycling
-        self.demo_timer.start(5000)  # Change view every 5 seconds
-    
-    def cycle_demo(self):
-        """Cycle through different demo views."""
-        if self.demo_step == 0:
-            print("📄 Showing file preview - Successful extraction (Q1 Report)")
-            self.preview_panel.update_file_preview(self.results[0], self.template_fields)
-            self.preview_panel.set_active_tab("File Preview")
+        def __init__(self):
+            super().__init__()
+            self.setWindowTitle("PreviewPanel Demo - LangExtractor")
+            self.setMinimumSize(900, 700)
+            self.resize(1200, 800)
+            
+            # Create central widget
+            central_widget = QWidget()
+            self.setCentralWidget(central_widget)
+            
+            # Layout
+            layout = QVBoxLayout(central_widget)
+            layout.setContentsMargins(16, 16, 16, 16)
             
-        elif self.demo_step == 1:
-            print("📄 Showing file preview - Another successful extraction (Q2 Report)")
-            self.preview_panel.update_file_preview(self.results[1], self.template_fields)
-            self.preview_panel.set_active_tab("File Preview")
+            # Create preview panel
+            self.preview_panel = PreviewPanel()
+            layout.addWidget(self.preview_panel)
             
-        elif self.demo_step == 2:
-            print("❌ Showing file preview - Failed extraction (Corrupted Document)")
-            self.preview_panel.update_file_preview(self.results[2], self.template_fields)
-            self.preview_panel.set_active_tab("File Preview")
+            # Load sample data
+            self.results, self.template_fields, self.session = create_sample_data()
             
-        elif self.demo_step == 3:
-            print("📊 Showing summary statistics and data quality")
-            self.preview_panel.update_summary_preview(self.session)
-            self.preview_panel.set_active_tab("Summary")
+            # Setup demo timer to cycle through different views
+            self.demo_timer = QTimer()
+            self.demo_timer.timeout.connect(self.cycle_demo)
+            self.demo_step = 0
             
-        elif self.demo_step == 4:
-            print("🔄 Back to file preview - Demonstrating confidence indicators")
-            self.preview_panel.update_file_preview(self.results[0], self.template_fields)
-            self.preview_panel.set_active_tab("File Preview")
+            # Start demo
+            self.start_demo()
         
-        self.demo_step = (self.demo_step + 1) % 5
+        def start_demo(self):
+            """Start the automated demo."""
+            print("🎬 Starting PreviewPanel Demo")
+            print("📋 Features demonstrated:")
+            print("   • File preview with extraction results")
+            print("   • Confidence indicators with color coding")
+            print("   • Data quality visualization")
+            print("   • Summary statistics")
+            print("   • Error handling display")
+            print("   • Modern, professional UI design")
+            print()
+            
+            # Show initial view
+            self.cycle_demo()
+            
+            # Start timer for automatic cycling
+            self.demo_timer.start(5000)  # Change view every 5 seconds
+        
+        def cycle_demo(self):
+            """Cycle through different demo views."""
+            if self.demo_step == 0:
+                print("📄 Showing file preview - Successful extraction (Q1 Report)")
+                self.preview_panel.update_file_preview(self.results[0], self.template_fields)
+                self.preview_panel.set_active_tab("File Preview")
+                
+            elif self.demo_step == 1:
+                print("📄 Showing file preview - Another successful extraction (Q2 Report)")
+                self.preview_panel.update_file_preview(self.results[1], self.template_fields)
+                self.preview_panel.set_active_tab("File Preview")
+                
+            elif self.demo_step == 2:
+                print("❌ Showing file preview - Failed extraction (Corrupted Document)")
+                self.preview_panel.update_file_preview(self.results[2], self.template_fields)
+                self.preview_panel.set_active_tab("File Preview")
+                
+            elif self.demo_step == 3:
+                print("📊 Showing summary statistics and data quality")
+                self.preview_panel.update_summary_preview(self.session)
+                self.preview_panel.set_active_tab("Summary")
+                
+            elif self.demo_step == 4:
+                print("🔄 Back to file preview - Demonstrating confidence indicators")
+                self.preview_panel.update_file_preview(self.results[0], self.template_fields)
+                self.preview_panel.set_active_tab("File Preview")
+            
+            self.demo_step = (self.demo_step + 1) % 5
+        
+        def closeEvent(self, event):
+            """Handle window close event."""
+            print("🏁 Demo completed!")
+            print("✅ PreviewPanel Phase 1 implementation verified")
+            event.accept()
     
-    def closeEvent(self, event):
-        """Handle window close event."""
-        print("🏁 Demo completed!")
-        print("✅ PreviewPanel Phase 1 implementation verified")
-        event.accept()
+    return PreviewPanelDemo()
 
 
 def main():
@@ -211,11 +222,13 @@ def main():
     print("🚀 LangExtractor PreviewPanel Demo")
     print("=" * 40)
     
+    from PySide6.QtWidgets import QApplication
+    
     # Create application
     app = QApplication(sys.argv)
     
     # Create and show demo window
-    demo = PreviewPanelDemo()
+    demo = create_demo_window()
     demo.show()
     
     # Run application
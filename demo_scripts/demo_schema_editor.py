@@ -7,16 +7,104 @@ and tests the button highlight behavior.
 
 import sys
 import os
+import functools
 from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from PySide6.QtWidgets import QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QMessageBox
-from PySide6.QtCore import Qt
 
-from gui.schema_editor import SchemaEditor
-from core.models import ExtractionTemplate, ExtractionField, FieldType
+
+# Global stylesheet that fixes QMessageBox button focus rings. Parsed once by
+# the application instead of on every DemoWindow instantiation.
+_DEMO_QSS = """
+    QMessageBox QPushButton {
+        background-color: #ffffff;
+        border: 1px solid #dee2e6;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-weight: 500;
+        min-height: 20px;
+        min-width: 60px;
+    }
+
+    QMessageBox QPushButton:hover {
+        background-color: #e9ecef;
+        border-color: #adb5bd;
+    }
+
+    QMessageBox QPushButton:pressed {
+        background-color: #dee2e6;
+    }
+
+    QMessageBox QPushButton:focus {
+        border: 2px solid #0d6efd;
+        padding: 7px 15px;
+    }
+
+    QMessageBox QPushButton:default {
+        background-color: #0d6efd;
+        border-color: #0d6efd;
+        color: white;
+    }
+
+    QMessageBox QPushButton:default:hover {
+        background-color: #0b5ed7;
+        border-color: #0a58ca;
+    }
+
+    QMessageBox QPushButton:default:focus {
+        border: 2px solid #ffffff;
+        padding: 7px 15px;
+    }
+"""
+
+
+@functools.cache
+def _sample_template():
+    """Build the sample template once; SchemaEditor only reads it."""
+    from core.models import ExtractionTemplate, ExtractionField, FieldType
+    
+    return ExtractionTemplate(
+        name="Company Information",
+        prompt_description="Extract company information from documents",
+        fields=[
+            ExtractionField(
+                name="company_name",
+                type=FieldType.TEXT,
+                description="Tên công ty",
+                optional=False
+            ),
+            ExtractionField(
+                name="revenue",
+                type=FieldType.CURRENCY,
+                description="Doanh thu hàng năm",
+                optional=False,
+                number_locale="vi-VN"
+            ),
+            ExtractionField(
+                name="employee_count",
+                type=FieldType.NUMBER,
+                description="Số lượng nhân viên làm việc tại công ty (bao gồm cả nhân viên toàn thời gian và bán thời gian)",
+                optional=True
+            ),
+            ExtractionField(
+                name="founded_date",
+                type=FieldType.DATE,
+                description="Ngày thành lập công ty theo định dạng dd/mm/yyyy",
+                optional=True
+            ),
+            ExtractionField(
+                name="headquarters_address",
+                type=FieldType.TEXT,
+                description="Địa chỉ trụ sở chính của công ty bao gồm số nhà, tên đường, quận/huyện, thành phố/tỉnh",
+                optional=False
+            )
+        ]
+    )
 
 
 class DemoWindow(QMainWindow):
@@ -27,49 +115,6 @@ class DemoWindow(QMainWindow):
         self.setWindowTitle("Schema Editor Demo")
         self.setGeometry(100, 100, 400, 300)
         
-        # Apply global style to fix button focus rings
-        self.setStyleSheet("""
-            QMessageBox QPushButton {
-                background-color: #ffffff;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: 500;
-                min-height: 20px;
-                min-width: 60px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #e9ecef;
-                border-color: #adb5bd;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #dee2e6;
-            }
-            
-            QMessageBox QPushButton:focus {
-                border: 2px solid #0d6efd;
-                padding: 7px 15px;
-            }
-            
-            QMessageBox QPushButton:default {
-                background-color: #0d6efd;
-                border-color: #0d6efd;
-                color: white;
-            }
-            
-            QMessageBox QPushButton:default:hover {
-                background-color: #0b5ed7;
-                border-color: #0a58ca;
-            }
-            
-            QMessageBox QPushButton:default:focus {
-                border: 2px solid #ffffff;
-                padding: 7px 15px;
-            }
-        """)
-        
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -95,6 +140,8 @@ class DemoWindow(QMainWindow):
     
     def create_new_schema(self):
         """Create a new schema."""
+        from gui.schema_editor import SchemaEditor
+        
         dialog = SchemaEditor()
         if dialog.exec() == SchemaEditor.Accepted:
             template_data = dialog.get_template()
@@ -106,46 +153,9 @@ class DemoWindow(QMainWindow):
     
     def edit_sample_schema(self):
         """Edit a sample schema."""
-        # Create sample template
-        sample_template = ExtractionTemplate(
-            name="Company Information",
-            prompt_description="Extract company information from documents",
-            fields=[
-                ExtractionField(
-                    name="company_name",
-                    type=FieldType.TEXT,
-                    description="Tên công ty",
-                    optional=False
-                ),
-                ExtractionField(
-                    name="revenue",
-                    type=FieldType.CURRENCY,
-                    description="Doanh thu hàng năm",
-                    optional=False,
-                    number_locale="vi-VN"
-                ),
-                ExtractionField(
-                    name="employee_count",
-                    type=FieldType.NUMBER,
-                    description="Số lượng nhân viên làm việc tại công ty (bao gồm cả nhân viên toàn thời gian và bán thời gian)",
-                    optional=True
-                ),
-                ExtractionField(
-                    name="founded_date",
-                    type=FieldType.DATE,
-                    description="Ngày thành lập công ty theo định dạng dd/mm/yyyy",
-                    optional=True
-                ),
-                ExtractionField(
-                    name="headquarters_address",
-                    type=FieldType.TEXT,
-                    description="Địa chỉ trụ sở chính của công ty bao gồm số nhà, tên đường, quận/huyện, thành phố/tỉnh",
-                    optional=False
-                )
-            ]
-        )
+        from gui.schema_editor import SchemaEditor
         
-        dialog = SchemaEditor(sample_template)
+        dialog = SchemaEditor(_sample_template())
         if dialog.exec() == SchemaEditor.Accepted:
             template_data = dialog.get_template()
             QMessageBox.information(
@@ -176,6 +186,7 @@ def main():
     
     # Set application style
     app.setStyle('Fusion')  # Use Fusion style for better cross-platform appearance
+    app.setStyleSheet(_DEMO_QSS)
     
     # Create and show demo window
     window = DemoWindow()
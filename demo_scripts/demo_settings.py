@@ -14,7 +14,9 @@ from pathlib import Path
 from PySide6.QtWidgets import QApplication
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from gui.settings_dialog import SettingsDialog
 from core.models import AppConfig
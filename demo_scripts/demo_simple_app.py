@@ -14,17 +14,47 @@ Không có analytics dashboard hay charts phức tạp.
 import sys
 import os
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
 import tempfile
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
-from gui.simple_main_window import SimpleMainWindow
+
+# Console banner printed on startup, written in a single call
+_STARTUP_BANNER = """\
+🚀 LangExtractor Simple Started!
+
+📋 Workflow đơn giản:
+  1️⃣ Import file PDF/Word (drag-drop hoặc nút 'Thêm file')
+  2️⃣ Cấu hình Schema (nút 'Cấu hình Schema' - có thể dùng tên tiếng Việt)
+  3️⃣ Xử lý với OCR + AI (nút 'Bắt đầu xử lý')
+  4️⃣ Xem trước kết quả (tab 'Chi tiết file' và 'Tổng quan')
+  5️⃣ Xuất Excel (nút 'Xuất Excel')
+
+✨ Đơn giản và tập trung vào những gì bạn cần!
+💡 Không có analytics dashboard phức tạp hay charts thừa thãi
+
+🎯 Hướng dẫn:
+  • Thử drag-drop file PDF hoặc Word vào cửa sổ
+  • Click 'Cấu hình Schema' để định nghĩa các trường cần trích
+  • Có thể dùng tên tiếng Việt như 'tên công ty', 'doanh thu', etc.
+  • Click 'Bắt đầu xử lý' sau khi có file + schema
+  • Xem kết quả trong 2 tab: Chi tiết file và Tổng quan
+  • Click 'Xuất Excel' để có file Excel với dữ liệu đã trích
+"""
 
 
 def main():
     """Chạy ứng dụng đơn giản."""
+    from PySide6.QtWidgets import QApplication
+    from gui.simple_main_window import SimpleMainWindow
+    
+    # --quiet skips the startup banner and is not passed on to Qt
+    verbose = "--quiet" not in sys.argv
+    sys.argv[:] = [arg for arg in sys.argv if arg != "--quiet"]
+    
     app = QApplication(sys.argv)
     
     # Set app properties
@@ -35,22 +65,9 @@ def main():
     window = SimpleMainWindow()
     window.show()
     
-    print("🚀 LangExtractor Simple Started!")
-    print("\n📋 Workflow đơn giản:")
-    print("  1️⃣ Import file PDF/Word (drag-drop hoặc nút 'Thêm file')")
-    print("  2️⃣ Cấu hình Schema (nút 'Cấu hình Schema' - có thể dùng tên tiếng Việt)")
-    print("  3️⃣ Xử lý với OCR + AI (nút 'Bắt đầu xử lý')")
-    print("  4️⃣ Xem trước kết quả (tab 'Chi tiết file' và 'Tổng quan')")
-    print("  5️⃣ Xuất Excel (nút 'Xuất Excel')")
-    print("\n✨ Đơn giản và tập trung vào những gì bạn cần!")
-    print("💡 Không có analytics dashboard phức tạp hay charts thừa thãi")
-    print("\n🎯 Hướng dẫn:")
-    print("  • Thử drag-drop file PDF hoặc Word vào cửa sổ")
-    print("  • Click 'Cấu hình Schema' để định nghĩa các trường cần trích")
-    print("  • Có thể dùng tên tiếng Việt như 'tên công ty', 'doanh thu', etc.")
-    print("  • Click 'Bắt đầu xử lý' sau khi có file + schema")
-    print("  • Xem kết quả trong 2 tab: Chi tiết file và Tổng quan")
-    print("  • Click 'Xuất Excel' để có file Excel với dữ liệu đã trích")
+    if verbose:
+        sys.stdout.write(_STARTUP_BANNER)
+        sys.stdout.flush()
     
     return app.exec()
 
@@ -15,8 +15,9 @@ from pathlib import Path
 from datetime import datetime
 
 # Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from core.excel_exporter import ExcelExporter
 from core.models import ExtractionTemplate, ExtractionField, FieldType
@@ -16,8 +16,9 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QTimer
 
 # Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from gui.main_window import MainWindow
 from gui.theme import get_theme_manager
@@ -36,12 +37,12 @@ def setup_demo_logging():
 def demo_theme_switching(main_window):
     """Demonstrate automatic theme switching."""
     logger = get_logger(__name__)
+    app = QApplication.instance()
     
     def switch_theme():
         current_theme = main_window.theme_manager.get_current_theme()
         new_theme = "dark" if current_theme == "light" else "light"
         
-        app = QApplication.instance()
         main_window.theme_manager.apply_theme(app, new_theme)
         
         logger.info(f"Demo: Switched to {new_theme} theme")
@@ -23,9 +23,10 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QAction, QIcon, QDragEnterEvent, QDropEvent, QDragMoveEvent, QPainter, QPen
 from gui.theme import get_theme_manager
 from gui.enhanced_preview_panel import EnhancedPreviewPanel
-from core.processing_orchestrator import ProcessingOrchestrator, ProcessingProgress
+from core.processing_orchestrator import ProcessingOrchestrator, ProcessingProgress, SessionSnapshot
 from core.excel_exporter import ExcelExporter
 from core.aggregator import Aggregator
+from core.models import ProcessingSession
 from datetime import datetime
 from gui.schema_editor import SchemaEditor
 
@@ -100,6 +101,34 @@ class FileListWidget(QListWidget):
         Returns:
             True if file was added, False if duplicate or unsupported
         """
+        if not self._append_file(file_path):
+            return False
+        
+        self.files_changed.emit()
+        return True
+    
+    def add_files(self, file_paths: List[str]) -> int:
+        """
+        Add several files, repainting and notifying listeners only once.
+        
+        Args:
+            file_paths: Paths of the files to add
+            
+        Returns:
+            Number of files that were added
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            added_count = sum(1 for file_path in file_paths if self._append_file(file_path))
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        if added_count:
+            self.files_changed.emit()
+        return added_count
+    
+    def _append_file(self, file_path: str) -> bool:
+        """Create the list item for a file without emitting files_changed."""
         path = Path(file_path)
         
         # Check if file already exists
@@ -126,7 +155,6 @@ class FileListWidget(QListWidget):
         item.setToolTip(str(path))
         
         self.addItem(item)
-        self.files_changed.emit()
         
         logger.info(f"Added file to list: {path.name}")
         return True
@@ -946,6 +974,9 @@ class MainWindow(QMainWindow):
         # Reset UI for new processing session
         self.start_new_processing()
         
+        # Charts are fed from GUI-owned results built up from file_completed snapshots
+        self.live_session = ProcessingSession(template=template, files=file_paths)
+        
         # Start processing with orchestrator
         success = self.processing_orchestrator.start_processing(file_paths, template)
         
@@ -1010,16 +1041,19 @@ class MainWindow(QMainWindow):
         )
         self.status_bar.showMessage(status_message)
     
-    def on_file_completed(self, result):
-        """Handle individual file completion."""
-        # File preview could be updated here if needed
-        logger.debug(f"File completed: {result.source_file}")
+    def on_file_completed(self, snapshot: SessionSnapshot):
+        """Handle file completion snapshots for real-time chart updates."""
+        self.live_session.results.extend(snapshot.results)
+        
+        # Update charts with new data
+        self.preview_panel.update_summary_preview(self.live_session)
+        logger.debug(f"File completed: {snapshot.last_result.source_file} "
+                     f"({snapshot.completed}/{snapshot.total})")
     
     def on_session_updated(self, session):
-        """Handle session updates for real-time chart updates."""
-        # Update charts with new data
+        """Handle the final session update."""
         self.preview_panel.update_summary_preview(session)
-        logger.debug("Charts updated with new session data")
+        logger.debug("Charts updated with final session data")
     
     def on_processing_completed(self, session):
         """Handle processing completion."""
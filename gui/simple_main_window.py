@@ -24,14 +24,14 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QAction, QIcon, QDragEnterEvent, QDropEvent, QDragMoveEvent, QPainter, QPen
 from gui.theme import get_theme_manager
 from gui.simple_preview_panel import SimplePreviewPanel
-from core.processing_orchestrator import ProcessingOrchestrator, ProcessingProgress
+from core.processing_orchestrator import ProcessingOrchestrator, ProcessingProgress, SessionSnapshot
 from core.excel_exporter import ExcelExporter
 from core.aggregator import Aggregator
 from datetime import datetime
 from gui.schema_editor import SchemaEditor
 from gui.settings_dialog import SettingsDialog
 from core.utils import load_app_config, save_app_config
-from core.models import AppConfig
+from core.models import AppConfig, ProcessingSession
 from core.keychain import KeychainManager
 
 logger = logging.getLogger(__name__)
@@ -586,6 +586,9 @@ class SimpleMainWindow(QMainWindow):
         self.preview_panel.start_processing_session()
         self.start_new_processing()
         
+        # Charts are fed from GUI-owned results built up from file_completed snapshots
+        self.live_session = ProcessingSession(template=self.current_template, files=file_paths)
+        
         success = self.processing_orchestrator.start_processing(file_paths, self.current_template)
         
         if success:
@@ -651,9 +654,10 @@ class SimpleMainWindow(QMainWindow):
         self.show_progress(f"Đang xử lý {progress.current_file_name}...", 
                           progress.current_file, progress.total_files)
     
-    def on_file_completed(self, result):
+    def on_file_completed(self, snapshot: SessionSnapshot):
         """Handle file completion."""
-        pass
+        self.live_session.results.extend(snapshot.results)
+        self.preview_panel.update_summary_preview(self.live_session)
     
     def on_session_updated(self, session):
         """Handle session updates."""
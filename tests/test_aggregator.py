@@ -277,6 +277,17 @@ class TestAggregator(unittest.TestCase):
         self.assertEqual(employee_summary['max_value'], 150)
         self.assertEqual(employee_summary['mean_value'], 112.5)
     
+    def test_field_statistics_currency_fields_keep_decimal(self):
+        """Test currency statistics are computed with exact Decimal arithmetic."""
+        aggregation_result = self.aggregator.aggregate_results(self.sample_results)
+        revenue_summary = aggregation_result['summary_statistics']['field_summaries']['revenue']
+        
+        self.assertEqual(revenue_summary['min_value'], Decimal("500000000"))
+        self.assertEqual(revenue_summary['max_value'], Decimal("1000000000"))
+        self.assertIsInstance(revenue_summary['mean_value'], Decimal)
+        self.assertEqual(revenue_summary['mean_value'], Decimal("750000000"))
+        self.assertEqual(revenue_summary['median_value'], Decimal("750000000"))
+    
     def test_field_statistics_text_fields(self):
         """Test statistics calculation for text fields."""
         aggregation_result = self.aggregator.aggregate_results(self.sample_results)
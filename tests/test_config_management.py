@@ -178,6 +178,43 @@ class TestConfigManagement:
         assert isinstance(config, AppConfig)
         assert config.ocr_enabled is True  # Default value
     
+    def test_load_config_reuses_parsed_file(self, mock_app_data_dir):
+        """Test an unchanged config file is parsed only once."""
+        config_file = mock_app_data_dir / 'config.json'
+        config_file.write_text('{"max_workers": 8}', encoding='utf-8')
+        
+        with patch('core.utils._json_loads', wraps=json.loads) as mock_loads:
+            first = load_config()
+            second = load_config()
+        
+        assert mock_loads.call_count == 1
+        assert first == second
+        
+        # Callers get independent copies
+        first.ocr_languages.append('fr')
+        assert load_config().ocr_languages == ['vi', 'en']
+    
+    def test_save_config_skips_unchanged_config(self, mock_app_data_dir):
+        """Test saving a config identical to the file on disk does not rewrite it."""
+        save_config(AppConfig(max_workers=8))
+        
+        with patch('core.utils._write_bytes_atomic') as mock_write:
+            save_config(AppConfig(max_workers=8))
+            mock_write.assert_not_called()
+            
+            save_config(AppConfig(max_workers=16))
+            mock_write.assert_called_once()
+    
+    def test_load_config_rereads_modified_file(self, mock_app_data_dir):
+        """Test a config file edited on disk is parsed again."""
+        save_config(AppConfig(max_workers=8))
+        assert load_config().max_workers == 8
+        
+        config_file = mock_app_data_dir / 'config.json'
+        config_file.write_text('{"max_workers": 16}', encoding='utf-8')
+        
+        assert load_config().max_workers == 16
+    
     def test_save_config_success(self, mock_app_data_dir):
         """Test successful config saving."""
         config = AppConfig(
@@ -211,10 +248,21 @@ class TestConfigManagement:
             assert non_existent_dir.exists()
             assert (non_existent_dir / 'config.json').exists()
     
-    @patch('builtins.open')
-    def test_save_config_io_error(self, mock_open, mock_app_data_dir):
+    def test_save_config_recreates_removed_directory(self, temp_dir):
+        """Test saving still works after the app data directory was deleted."""
+        app_dir = temp_dir / 'app'
+        
+        with patch('core.utils.get_app_data_dir', return_value=app_dir):
+            save_config(AppConfig())
+            shutil.rmtree(app_dir)
+            
+            save_config(AppConfig(max_workers=8))
+            assert load_config().max_workers == 8
+    
+    @patch('pathlib.Path.write_bytes')
+    def test_save_config_io_error(self, mock_write, mock_app_data_dir):
         """Test handling of IO errors during config save."""
-        mock_open.side_effect = OSError("Permission denied")
+        mock_write.side_effect = OSError("Permission denied")
         
         config = AppConfig()
         
@@ -223,6 +271,17 @@ class TestConfigManagement:
         
         assert "Failed to save configuration" in str(exc_info.value)
     
+    def test_failed_save_keeps_previous_config(self, mock_app_data_dir):
+        """Test an interrupted save leaves the old file intact and no temp file."""
+        save_config(AppConfig(max_workers=8))
+        
+        with patch('core.utils.os.replace', side_effect=OSError("Disk full")):
+            with pytest.raises(ConfigurationError):
+                save_config(AppConfig(max_workers=16))
+        
+        assert load_config().max_workers == 8
+        assert [p.name for p in mock_app_data_dir.iterdir()] == ['config.json']
+    
     def test_save_and_load_roundtrip(self, mock_app_data_dir):
         """Test saving and loading config maintains data integrity."""
         original_config = AppConfig(
@@ -290,6 +349,19 @@ class TestConfigManagement:
         assert loaded_config.ocr_languages == ['vi', 'en', 'zh']
         assert loaded_config.log_level == 'THÔNG TIN'
     
+    def test_config_same_output_without_orjson(self, mock_app_data_dir):
+        """Test the stdlib json fallback writes the same file as orjson."""
+        config = AppConfig(log_level='THÔNG TIN')
+        config_file = mock_app_data_dir / 'config.json'
+        
+        save_config(config)
+        default_output = config_file.read_bytes()
+        
+        with patch('core.utils.ORJSON_AVAILABLE', False):
+            save_config(config)
+            assert config_file.read_bytes() == default_output
+            assert load_config().log_level == 'THÔNG TIN'
+    
     def test_config_validation_edge_cases(self):
         """Test AppConfig with edge case values."""
         # Test with extreme values
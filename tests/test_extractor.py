@@ -162,6 +162,20 @@ class TestExtractor:
         
         assert "Invalid" in str(exc_info.value)
     
+    def test_warmup_caches_api_key(self, extractor, mock_keychain, sample_template):
+        """Test warmup loads the API key once for later extractions."""
+        assert extractor.warmup(sample_template) is True
+        assert extractor._get_api_key() == "test-api-key"
+        
+        mock_keychain.load_api_key.assert_called_once()
+        mock_keychain.validate_api_key.assert_called_once()
+    
+    def test_warmup_failure_is_not_raised(self, extractor, mock_keychain):
+        """Test warmup reports credential problems without raising."""
+        mock_keychain.load_api_key.return_value = None
+        
+        assert extractor.warmup() is False
+    
     def test_convert_template_to_langextract(self, extractor, sample_template):
         """Test template conversion to langextract format."""
         prompt_description, examples = extractor._convert_template_to_langextract(sample_template)
@@ -191,6 +205,13 @@ class TestExtractor:
         assert prompt_description == template.prompt_description
         assert len(examples) >= 1  # Should create basic example
     
+    def test_convert_template_is_cached(self, extractor, sample_template):
+        """Test repeated conversions of the same template reuse compiled examples."""
+        _, first_examples = extractor._convert_template_to_langextract(sample_template)
+        _, second_examples = extractor._convert_template_to_langextract(sample_template)
+        
+        assert first_examples is second_examples
+    
     def test_chunk_text_small(self, extractor):
         """Test text chunking with small text."""
         text = "This is a small text that doesn't need chunking."
@@ -277,6 +298,119 @@ class TestExtractor:
         assert result.processing_time > 0
         assert len(result.errors) == 0
     
+    @patch('core.extractor.lx.extract')
+    def test_extract_batch_single_request(self, mock_langextract, extractor, sample_template):
+        """Test several small texts are extracted with one langextract call."""
+        class MockExtraction:
+            def __init__(self, class_name, text):
+                self.extraction_class = class_name
+                self.extraction_text = text
+                self.confidence = 0.9
+        
+        class MockDocument:
+            def __init__(self, document_id, company):
+                self.document_id = document_id
+                self.extractions = [MockExtraction("company_name", company)]
+        
+        def fake_extract(text_or_documents, **kwargs):
+            return [MockDocument(doc.document_id, doc.text.split()[0]) for doc in text_or_documents]
+        
+        mock_langextract.side_effect = fake_extract
+        
+        results = extractor.extract_batch(["Alpha has 10 staff", "Beta has 20 staff"], sample_template)
+        
+        mock_langextract.assert_called_once()
+        assert [r.status for r in results] == [ProcessingStatus.COMPLETED] * 2
+        assert results[0].extracted_data["company_name"] == "Alpha"
+        assert results[1].extracted_data["company_name"] == "Beta"
+    
+    @patch('core.extractor.lx.extract')
+    def test_extract_reuses_cached_result(self, mock_langextract, mock_keychain, mock_pii_masker, sample_template):
+        """Test an identical request is answered from the result cache."""
+        class MockExtraction:
+            def __init__(self, class_name, text):
+                self.extraction_class = class_name
+                self.extraction_text = text
+                self.confidence = 0.9
+        
+        mock_langextract.return_value = Mock(extractions=[MockExtraction("company_name", "Test Corp")])
+        text = "Test Corp has 150 employees"
+        
+        extractor = Extractor(keychain_manager=mock_keychain, pii_masker=mock_pii_masker, cache_results=True)
+        
+        first = extractor.extract(text, sample_template)
+        first.extracted_data["company_name"] = "Mutated"
+        second = extractor.extract(text, sample_template)
+        
+        mock_langextract.assert_called_once()
+        assert second.status == ProcessingStatus.COMPLETED
+        assert second.extracted_data == {"company_name": "Test Corp"}
+        assert second.confidence_scores == {"company_name": 0.9}
+        
+        # A different text still goes to the API
+        extractor.extract("Other Corp", sample_template)
+        assert mock_langextract.call_count == 2
+        
+        # Other extractors keep their own cache
+        Extractor(keychain_manager=mock_keychain, pii_masker=mock_pii_masker, cache_results=True).extract(text, sample_template)
+        assert mock_langextract.call_count == 3
+    
+    @patch('core.extractor.lx.extract')
+    def test_extract_does_not_cache_by_default(self, mock_langextract, extractor, sample_template):
+        """Test results are not cached unless caching is enabled."""
+        mock_langextract.return_value = Mock(extractions=[])
+        extractor.extract("Test Corp has 150 employees", sample_template)
+        extractor.extract("Test Corp has 150 employees", sample_template)
+        
+        assert mock_langextract.call_count == 2
+    
+    @patch('core.extractor.lx.extract')
+    def test_extract_does_not_cache_empty_result(self, mock_langextract, mock_keychain, mock_pii_masker, sample_template):
+        """Test an empty result is retried instead of being cached."""
+        mock_langextract.return_value = Mock(extractions=[])
+        extractor = Extractor(keychain_manager=mock_keychain, pii_masker=mock_pii_masker, cache_results=True)
+        
+        extractor.extract("Test Corp has 150 employees", sample_template)
+        extractor.extract("Test Corp has 150 employees", sample_template)
+        
+        assert mock_langextract.call_count == 2
+    
+    @patch('core.extractor.lx.extract')
+    def test_extract_batch_sends_only_uncached_texts(self, mock_langextract, extractor, sample_template):
+        """Test batch extraction only sends texts without a cached result."""
+        extractor.cache_results = True
+        
+        class MockExtraction:
+            def __init__(self, class_name, text):
+                self.extraction_class = class_name
+                self.extraction_text = text
+                self.confidence = 0.9
+        
+        class MockDocument:
+            def __init__(self, document_id, company):
+                self.document_id = document_id
+                self.extractions = [MockExtraction("company_name", company)]
+        
+        def fake_extract(text_or_documents, **kwargs):
+            if isinstance(text_or_documents, str):
+                return Mock(extractions=[MockExtraction("company_name", text_or_documents.split()[0])])
+            return [MockDocument(doc.document_id, doc.text.split()[0]) for doc in text_or_documents]
+        
+        mock_langextract.side_effect = fake_extract
+        extractor.extract("Alpha has 10 staff", sample_template)
+        
+        results = extractor.extract_batch(
+            ["Alpha has 10 staff", "Beta has 20 staff", "Gamma has 30 staff"], sample_template
+        )
+        
+        sent = mock_langextract.call_args[1]['text_or_documents']
+        assert [doc.text for doc in sent] == ["Beta has 20 staff", "Gamma has 30 staff"]
+        assert [r.extracted_data["company_name"] for r in results] == ["Alpha", "Beta", "Gamma"]
+        
+        # Every text is cached now, so no further request is made
+        extractor.extract_batch(["Beta has 20 staff", "Gamma has 30 staff"], sample_template)
+        assert mock_langextract.call_count == 2
+    
     def test_extract_empty_text(self, extractor, sample_template):
         """Test extraction with empty text."""
         result = extractor.extract("", sample_template)
@@ -572,6 +706,24 @@ class TestExtractorErrorScenarios:
         except Exception as e:
             pytest.fail(f"Should handle conversion errors gracefully: {e}")
 
+    def test_extracted_keys_reuse_template_field_names(self):
+        """Test result dicts are keyed by the template's field name objects."""
+        extractor = Extractor(offline_mode=True)
+        field = ExtractionField("company_name", FieldType.TEXT, "Company")
+        template = ExtractionTemplate(name="Test", prompt_description="Test", fields=[field])
+
+        extraction = Mock()
+        extraction.extraction_class = "".join(["company", "_name"])  # Distinct string object
+        extraction.extraction_text = "ACME"
+        extraction.confidence = 0.9
+        mock_result = Mock(extractions=[extraction])
+
+        extracted_data, confidence_scores = extractor._validate_extraction_result(mock_result, template)
+
+        assert extracted_data == {"company_name": "ACME"}
+        assert next(iter(extracted_data)) is field.name
+        assert next(iter(confidence_scores)) is field.name
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
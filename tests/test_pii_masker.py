@@ -361,6 +361,35 @@ class TestMaskForCloud:
         result = self.masker.mask_for_cloud(original_text)
         assert result == original_text
 
+    
+    def test_mask_for_cloud_batch_matches_single(self):
+        """Test batch masking gives the same result as masking each text."""
+        texts = [
+            "CMND: 123456789",
+            "",
+            "Email: john@example.com, SĐT 0987654321",
+            "Tài khoản 12345678901234",
+            "Không có thông tin nhạy cảm"
+        ]
+        
+        result = self.masker.mask_for_cloud_batch(texts)
+        
+        assert result == [self.masker.mask_for_cloud(text) for text in texts]
+    
+    def test_mask_for_cloud_batch_text_containing_separator(self):
+        """Test texts containing the separator are still masked individually."""
+        texts = ["CMND: 123456789\x1e", "Email: john@example.com"]
+        
+        result = self.masker.mask_for_cloud_batch(texts)
+        
+        assert result == ["CMND: 12*****89\x1e", "Email: jo**@ex*****.com"]
+    
+    def test_mask_for_cloud_batch_invalid_input(self):
+        """Test batch masking rejects non-string input."""
+        with pytest.raises(LangExtractorError) as exc_info:
+            self.masker.mask_for_cloud_batch(["ok", 123])
+        
+        assert "Invalid input type" in str(exc_info.value)
 
 class TestMaskingControl:
     """Test cases for masking enable/disable functionality."""
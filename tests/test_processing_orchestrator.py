@@ -0,0 +1,250 @@
+"""
+Test suite for the ProcessingOrchestrator pipeline.
+
+Tests file processing through the ingest/extract stages with mocked
+Ingestor and Extractor components, result recording, caching and
+signal coalescing.
+"""
+
+import gc
+import sys
+from threading import Event
+
+import pytest
+from unittest.mock import Mock, patch
+from PySide6.QtCore import QCoreApplication
+
+from core.processing_orchestrator import ProcessingOrchestrator
+from core.models import (
+    ExtractionTemplate, ExtractionField, ExtractionResult,
+    FieldType, ProcessingStatus
+)
+
+
+@pytest.fixture
+def app():
+    """Create QCoreApplication instance so queued signals can be delivered."""
+    if not QCoreApplication.instance():
+        return QCoreApplication(sys.argv)
+    return QCoreApplication.instance()
+
+
+class TestProcessingOrchestrator:
+    """Test suite for ProcessingOrchestrator class."""
+    
+    @pytest.fixture
+    def sample_template(self):
+        """Create sample extraction template."""
+        return ExtractionTemplate(
+            name="Company Info",
+            prompt_description="Extract company information from text",
+            fields=[
+                ExtractionField("company_name", FieldType.TEXT, "Name of the company"),
+                ExtractionField("revenue", FieldType.NUMBER, "Annual revenue", optional=True)
+            ]
+        )
+    
+    @pytest.fixture
+    def sample_files(self, tmp_path):
+        """Create sample input files on disk."""
+        files = []
+        for i in range(6):
+            path = tmp_path / f"report_{i}.txt"
+            path.write_text(f"Company {i} revenue {i * 100}", encoding='utf-8')
+            files.append(str(path))
+        return files
+    
+    @pytest.fixture
+    def mock_extractor(self):
+        """Create mock Extractor returning a completed result."""
+        def extract(text, template, cancel_token=None):
+            return ExtractionResult(
+                source_file="text_input",
+                extracted_data={"company_name": text.split(" revenue")[0]},
+                confidence_scores={"company_name": 0.9},
+                status=ProcessingStatus.COMPLETED
+            )
+        
+        extractor = Mock()
+        extractor.extract.side_effect = extract
+        extractor.extract_batch.side_effect = (
+            lambda texts, template, cancel_token=None: [extract(text, template) for text in texts]
+        )
+        return extractor
+    
+    @pytest.fixture
+    def orchestrator(self, app, mock_extractor):
+        """Create orchestrator with mocked ingestion and extraction."""
+        # Collect Qt objects left over by other test modules on the main thread,
+        # otherwise the collector may finalize them on a worker thread
+        gc.collect()
+        
+        with patch('core.processing_orchestrator.Extractor', return_value=mock_extractor):
+            orchestrator = ProcessingOrchestrator(max_workers=2)
+            orchestrator.ingestor = Mock()
+            orchestrator.ingestor.process.side_effect = (
+                lambda path, cancel_token=None: open(path, encoding='utf-8').read()
+            )
+            yield orchestrator
+            orchestrator._shutdown_pools()
+    
+    def _run(self, orchestrator, files, template):
+        """Start processing and wait for the worker thread to finish."""
+        assert orchestrator.start_processing(files, template)
+        orchestrator.processing_thread.join(timeout=10)
+        assert not orchestrator.processing_thread.is_alive()
+        
+        # Deliver signals queued from the worker threads
+        QCoreApplication.processEvents()
+        assert not orchestrator.is_processing_active()
+    
+    def test_processes_all_files(self, orchestrator, mock_extractor, sample_files, sample_template):
+        """Test every file produces exactly one completed result."""
+        completed = []
+        orchestrator.processing_completed.connect(completed.append)
+        
+        self._run(orchestrator, sample_files, sample_template)
+        
+        session = completed[0]
+        assert sorted(r.source_file for r in session.results) == sorted(sample_files)
+        assert all(r.status == ProcessingStatus.COMPLETED for r in session.results)
+        assert all(r.processing_time >= 0 for r in session.results)
+    
+    def test_ingestion_error_produces_failed_result(self, orchestrator, mock_extractor,
+                                                    sample_files, sample_template):
+        """Test a file that fails ingestion is recorded as failed."""
+        bad_file = sample_files[0]
+        
+        def process(path, cancel_token=None):
+            if path == bad_file:
+                raise OSError("Unreadable file")
+            return open(path, encoding='utf-8').read()
+        
+        orchestrator.ingestor.process.side_effect = process
+        self._run(orchestrator, sample_files, sample_template)
+        
+        results = {r.source_file: r for r in orchestrator.current_session.results}
+        assert results[bad_file].status == ProcessingStatus.FAILED
+        assert "Unreadable file" in results[bad_file].errors[0]
+        assert orchestrator.current_session.get_completed_count() == len(sample_files) - 1
+    
+    def test_cancellation_stops_processing(self, orchestrator, mock_extractor,
+                                           sample_files, sample_template):
+        """Test cancelling mid-ingestion records cancelled results only."""
+        def process(path, cancel_token=None):
+            orchestrator.cancel_processing()
+            cancel_token.raise_if_cancelled()
+            return open(path, encoding='utf-8').read()
+        
+        orchestrator.ingestor.process.side_effect = process
+        self._run(orchestrator, sample_files, sample_template)
+        
+        results = orchestrator.current_session.results
+        assert results
+        assert all(r.status == ProcessingStatus.CANCELLED for r in results)
+        mock_extractor.extract.assert_not_called()
+        mock_extractor.extract_batch.assert_not_called()
+    
+    @pytest.mark.parametrize("batch_size", [1, 3])
+    def test_extractor_status_is_passed_through(self, orchestrator, mock_extractor,
+                                                sample_template, batch_size):
+        """Test a failed extraction keeps its status and errors, batched or not."""
+        def extract(text, template, cancel_token=None):
+            return ExtractionResult(
+                source_file="text_input",
+                extracted_data={},
+                errors=["Extraction failed"],
+                status=ProcessingStatus.FAILED
+            )
+        
+        mock_extractor.extract.side_effect = extract
+        mock_extractor.extract_batch.side_effect = (
+            lambda texts, template, cancel_token=None: [extract(text, template) for text in texts]
+        )
+        orchestrator.extractor = mock_extractor
+        
+        batch = [(f"report_{i}.txt", "Company revenue", 0, None) for i in range(batch_size)]
+        results = orchestrator._extract_items(batch, sample_template)
+        
+        assert len(results) == batch_size
+        assert all(r.status == ProcessingStatus.FAILED for r in results)
+        assert all(r.errors == ["Extraction failed"] for r in results)
+    
+    @patch('core.processing_orchestrator.INGESTION_TIMEOUT', 0)
+    def test_ingestion_timeout_stops_file_cooperatively(self, orchestrator, mock_extractor,
+                                                        sample_files, sample_template):
+        """Test a file running past the time limit stops at its next check and fails."""
+        def process(path, cancel_token=None):
+            cancel_token.raise_if_cancelled()
+            return open(path, encoding='utf-8').read()
+        
+        orchestrator.ingestor.process.side_effect = process
+        self._run(orchestrator, sample_files, sample_template)
+        
+        results = orchestrator.current_session.results
+        assert len(results) == len(sample_files)
+        assert all(r.status == ProcessingStatus.FAILED for r in results)
+        assert all("timed out" in r.errors[0] for r in results)
+        mock_extractor.extract.assert_not_called()
+    
+    @patch('core.processing_orchestrator.INGESTION_TIMEOUT', 0.2)
+    def test_hung_ingestion_is_abandoned_after_time_limit(self, orchestrator, mock_extractor,
+                                                          sample_files, sample_template):
+        """Test a step that never checks the token still fails after the time limit."""
+        release = Event()
+        
+        def process(path, cancel_token=None):
+            release.wait(5)
+            return open(path, encoding='utf-8').read()
+        
+        orchestrator.ingestor.process.side_effect = process
+        try:
+            self._run(orchestrator, sample_files[:1], sample_template)
+        finally:
+            release.set()
+        
+        result = orchestrator.current_session.results[0]
+        assert result.status == ProcessingStatus.FAILED
+        assert "timed out" in result.errors[0]
+    
+    def test_reprocessing_uses_ingestion_cache(self, orchestrator, mock_extractor,
+                                               sample_files, sample_template):
+        """Test unchanged files are not ingested again on a second run."""
+        self._run(orchestrator, sample_files, sample_template)
+        self._run(orchestrator, sample_files, sample_template)
+        
+        assert orchestrator.ingestor.process.call_count == len(sample_files)
+    
+    def test_file_completions_are_coalesced(self, orchestrator, mock_extractor,
+                                            sample_files, sample_template):
+        """Test completion snapshots are batched but deliver every result."""
+        snapshots = []
+        session_updates = []
+        orchestrator.file_completed.connect(snapshots.append)
+        orchestrator.session_updated.connect(session_updates.append)
+        
+        self._run(orchestrator, sample_files, sample_template)
+        
+        assert 1 <= len(snapshots) <= len(sample_files)
+        assert sum(len(s.results) for s in snapshots) == len(sample_files)
+        assert snapshots[-1].completed == snapshots[-1].total == len(sample_files)
+        assert snapshots[-1].last_result is snapshots[-1].results[-1]
+        
+        # The mutable session is only published once processing has finished
+        assert session_updates == [orchestrator.current_session]
+    
+    def test_ready_items_share_one_batch_request(self, orchestrator, mock_extractor,
+                                                 sample_files, sample_template):
+        """Test several ingested files are extracted with a single batch call."""
+        orchestrator.extractor = mock_extractor
+        items = [
+            (path, open(path, encoding='utf-8').read(), 0, None)
+            for path in sample_files[:3]
+        ]
+        
+        results = orchestrator._extract_items(items, sample_template)
+        
+        mock_extractor.extract_batch.assert_called_once()
+        mock_extractor.extract.assert_not_called()
+        assert [r.source_file for r in results] == sample_files[:3]
+        assert results[1].extracted_data == {"company_name": "Company 1"}
@@ -7,10 +7,12 @@ enable/disable functionality, and error handling scenarios.
 
 import pytest
 import unittest.mock as mock
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, AsyncMock, patch, MagicMock
+import asyncio
 import logging
 import time
 
+import core.proofreader
 from core.proofreader import Proofreader
 from core.models import ProofreaderInterface
 from core.keychain import KeychainManager
@@ -18,10 +20,23 @@ from core.pii_masker import PIIMasker
 from core.exceptions import (
     LangExtractorError,
     CredentialError,
+    APIError,
     APIValidationError,
+    OperationCancelledError,
     ErrorCategory,
     ErrorSeverity
 )
+from core.cancellation import CancelToken
+
+
+@pytest.fixture(autouse=True)
+def clear_client_pool():
+    """Keep clients pooled with one test's mocks from leaking into the next."""
+    core.proofreader._CLIENT_POOL.clear()
+    core.proofreader._CONFIGURED_KEY = None
+    yield
+    core.proofreader._CLIENT_POOL.clear()
+    core.proofreader._CONFIGURED_KEY = None
 
 
 class TestProofreader:
@@ -40,6 +55,9 @@ class TestProofreader:
         """Mock PIIMasker for testing."""
         pii_masker = Mock(spec=PIIMasker)
         pii_masker.mask_for_cloud.return_value = "masked text"
+        pii_masker.mask_for_cloud_batch.side_effect = (
+            lambda texts: [pii_masker.mask_for_cloud(text) for text in texts]
+        )
         return pii_masker
     
     @pytest.fixture
@@ -80,7 +98,7 @@ class TestProofreader:
         assert proofreader.api_timeout == 30
         assert proofreader.correction_mode == 'auto'
         assert proofreader.model_name == 'gemini-2.5-pro'
-        assert proofreader._client is None  # Lazy initialization
+        assert proofreader._api_key is None  # Lazy initialization
     
     def test_initialization_custom_parameters(self, mock_keychain, mock_pii_masker):
         """Test Proofreader initialization with custom parameters."""
@@ -102,6 +120,20 @@ class TestProofreader:
         assert proofreader.keychain_manager is mock_keychain
         assert proofreader.pii_masker is mock_pii_masker
     
+    @patch('core.proofreader.PIIMasker')
+    @patch('core.proofreader.KeychainManager')
+    def test_dependencies_created_lazily(self, mock_keychain_cls, mock_masker_cls):
+        """Test a disabled proofreader never creates its credential manager or masker."""
+        proofreader = Proofreader(enabled=False)
+        
+        assert proofreader.proofread("Văn bản") == "Văn bản"
+        mock_keychain_cls.assert_not_called()
+        mock_masker_cls.assert_not_called()
+        
+        assert proofreader.pii_masker is mock_masker_cls.return_value
+        assert proofreader.pii_masker is mock_masker_cls.return_value
+        mock_masker_cls.assert_called_once()
+    
     def test_system_prompts_configuration(self):
         """Test that all system prompts are correctly configured."""
         prompts = Proofreader.SYSTEM_PROMPTS
@@ -126,20 +158,28 @@ class TestProofreader:
     @patch('core.proofreader.genai')
     def test_get_client_success(self, mock_genai, proofreader, mock_keychain):
         """Test successful Gemini API client initialization."""
-        # Setup mock
-        mock_model = Mock()
-        mock_response = Mock()
-        mock_response.text = "Test response"
-        mock_model.generate_content.return_value = mock_response
-        mock_genai.GenerativeModel.return_value = mock_model
+        api_key = proofreader._get_client()
         
-        # Test client initialization
-        client = proofreader._get_client()
-        
-        assert client is mock_model
-        assert proofreader._client is mock_model
+        assert api_key == "test_api_key_12345"
+        assert proofreader._get_client() == api_key
         mock_keychain.load_api_key.assert_called_once()
         mock_genai.configure.assert_called_once_with(api_key="test_api_key_12345")
+        mock_genai.GenerativeModel.assert_not_called()  # Requests use the per-mode models
+    
+    @patch('core.proofreader.genai')
+    def test_get_client_reconfigures_for_other_key(self, mock_genai, mock_keychain, mock_pii_masker):
+        """Test genai.configure runs again only when a different API key is used."""
+        other_keychain = Mock(spec=KeychainManager)
+        other_keychain.load_api_key.return_value = "other_api_key"
+        
+        Proofreader(keychain_manager=mock_keychain, pii_masker=mock_pii_masker)._get_client()
+        Proofreader(keychain_manager=mock_keychain, pii_masker=mock_pii_masker)._get_client()
+        Proofreader(keychain_manager=other_keychain, pii_masker=mock_pii_masker)._get_client()
+        
+        assert mock_genai.configure.call_args_list == [
+            mock.call(api_key="test_api_key_12345"),
+            mock.call(api_key="other_api_key"),
+        ]
     
     @patch('core.proofreader.genai')
     def test_get_client_no_api_key(self, mock_genai, proofreader, mock_keychain):
@@ -163,18 +203,23 @@ class TestProofreader:
         assert exc_info.value.category == ErrorCategory.API_ERROR
     
     @patch('core.proofreader.genai')
-    def test_get_client_api_test_failure(self, mock_genai, proofreader, mock_keychain):
-        """Test client initialization failure when API test fails."""
+    def test_get_client_sends_no_test_request(self, mock_genai, proofreader, mock_keychain):
+        """Test client initialization does not spend an API call on a probe."""
         mock_model = Mock()
-        mock_response = Mock()
-        mock_response.text = ""  # Empty response indicates failure
-        mock_model.generate_content.return_value = mock_response
         mock_genai.GenerativeModel.return_value = mock_model
         
-        with pytest.raises(APIValidationError) as exc_info:
-            proofreader._get_client()
+        proofreader._get_client()
         
-        assert "API test failed" in str(exc_info.value)
+        mock_model.generate_content.assert_not_called()
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_empty_response_fallback(self, mock_genai, proofreader):
+        """Test an empty API response falls back to the original text."""
+        mock_model = Mock()
+        mock_model.generate_content.return_value = Mock(text="")
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        assert proofreader.proofread("Original text") == "Original text"
     
     def test_detect_correction_mode_auto_financial(self, proofreader):
         """Test auto-detection of number_lock mode for financial text."""
@@ -182,6 +227,11 @@ class TestProofreader:
         mode = proofreader._detect_correction_mode(financial_text)
         assert mode == 'number_lock'
     
+    def test_detect_correction_mode_auto_foreign_currency(self, proofreader):
+        """Test upper-case currency codes are detected as financial text."""
+        assert proofreader._detect_correction_mode("Giá bán: 2,5 USD") == 'number_lock'
+        assert proofreader._detect_correction_mode("Thanh toán 300 EUR") == 'number_lock'
+    
     def test_detect_correction_mode_auto_business(self, proofreader):
         """Test auto-detection of business mode for business reports."""
         business_text = "Báo cáo kết quả kinh doanh quý IV cho thấy lợi nhuận tăng trường."
@@ -229,8 +279,8 @@ class TestProofreader:
         # Verify PII masking was applied
         mock_pii_masker.mask_for_cloud.assert_called_once_with(test_text)
         
-        # Verify API call was made (twice: once for test, once for actual proofreading)
-        assert mock_model.generate_content.call_count == 2
+        # Verify a single API call was made
+        assert mock_model.generate_content.call_count == 1
         
         assert result == "Corrected Vietnamese text"
     
@@ -326,11 +376,11 @@ class TestProofreader:
     def test_set_offline_mode(self, proofreader):
         """Test set_offline_mode method."""
         # Initialize client first
-        proofreader._client = Mock()
+        proofreader._api_key = "test_api_key_12345"
         
         proofreader.set_offline_mode(True)
         assert proofreader.offline_mode is True
-        assert proofreader._client is None  # Should clear client
+        assert proofreader._api_key is None  # Should clear client
         
         proofreader.set_offline_mode(False)
         assert proofreader.offline_mode is False
@@ -409,11 +459,412 @@ class TestProofreader:
         
         proofreader.proofread("Test text")
         
-        # Verify timeout was passed to API call (called twice: test + proofread)
-        assert mock_model.generate_content.call_count == 2
+        # Verify timeout was passed to API call
+        assert mock_model.generate_content.call_count == 1
         call_args = mock_model.generate_content.call_args_list
         assert call_args[0][1]['request_options']['timeout'] == 60
-        assert call_args[1][1]['request_options']['timeout'] == 60
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_batch(self, mock_genai, proofreader):
+        """Test batch proofreading returns corrected texts in input order."""
+        mock_model = Mock()
+        mock_model.generate_content_async = AsyncMock(
+            side_effect=lambda prompt, **kwargs: Mock(text=f"corrected {len(prompt)}")
+        )
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        texts = ["Văn bản một", "", "Văn bản hai dài hơn"]
+        results = asyncio.run(proofreader.proofread_batch(texts))
+        
+        assert len(results) == 3
+        assert results[1] == ""  # Empty text is not sent
+        assert results[0].startswith("corrected") and results[2].startswith("corrected")
+        assert mock_model.generate_content_async.call_count == 2
+        assert mock_genai.GenerativeModel.call_count == 1  # Mode model created once
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_batch_error_returns_original_text(self, mock_genai, proofreader, mock_pii_masker):
+        """Test a failed request in a batch yields its original text, not an exception."""
+        mock_pii_masker.mask_for_cloud_batch.side_effect = lambda texts: texts
+        mock_model = Mock()
+        mock_model.generate_content_async = AsyncMock(
+            side_effect=lambda prompt, **kwargs: (
+                Mock(text="Corrected") if prompt.endswith("một") else Mock(text="")
+            )
+        )
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        results = asyncio.run(proofreader.proofread_batch(["Văn bản một", "Văn bản hai"]))
+        
+        assert results == ["Corrected", "Văn bản hai"]
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_batch_masks_in_one_pass(self, mock_genai, proofreader, mock_pii_masker):
+        """Test batch proofreading masks all texts with a single batch call."""
+        mock_pii_masker.mask_for_cloud_batch.side_effect = lambda texts: [f"masked {t}" for t in texts]
+        mock_model = Mock()
+        mock_model.generate_content_async = AsyncMock(return_value=Mock(text="Corrected"))
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        asyncio.run(proofreader.proofread_batch(["Văn bản một", "Văn bản hai"]))
+        
+        mock_pii_masker.mask_for_cloud_batch.assert_called_once_with(["Văn bản một", "Văn bản hai"])
+        mock_pii_masker.mask_for_cloud.assert_not_called()
+        prompts = [c[0][0] for c in mock_model.generate_content_async.call_args_list]
+        assert sorted(prompts) == [
+            Proofreader.REQUEST_PREFIX + "masked Văn bản hai",
+            Proofreader.REQUEST_PREFIX + "masked Văn bản một"
+        ]
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_batch_bounded_concurrency(self, mock_genai, mock_keychain, mock_pii_masker):
+        """Test no more than max_concurrent_requests calls are in flight."""
+        proofreader = Proofreader(
+            keychain_manager=mock_keychain,
+            pii_masker=mock_pii_masker,
+            max_concurrent_requests=2
+        )
+        in_flight = 0
+        peak = 0
+        
+        async def generate(prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(text="Corrected")
+        
+        mock_model = Mock()
+        mock_model.generate_content_async = generate
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        results = asyncio.run(proofreader.proofread_batch(["Văn bản"] * 6))
+        
+        assert results == ["Corrected"] * 6
+        assert peak == 2
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_stream_yields_pieces(self, mock_genai, proofreader):
+        """Test streamed proofreading yields text as it arrives and caches the result."""
+        mock_model = Mock()
+        mock_model.generate_content.return_value = iter(
+            [Mock(text="  Văn bản "), Mock(text=" "), Mock(text="đã sửa.\n")]
+        )
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        pieces = list(proofreader.proofread_stream("Van ban"))
+        
+        assert pieces == ["Văn bản", "  đã sửa."]
+        assert mock_model.generate_content.call_args[1]['stream'] is True
+        
+        # The joined text is cached like a regular proofread result
+        assert proofreader.proofread("Van ban") == "Văn bản  đã sửa."
+        assert mock_model.generate_content.call_count == 1
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_stream_error_fallback(self, mock_genai, proofreader):
+        """Test a stream that fails before producing text yields the original text."""
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = Exception("API Error")
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        assert list(proofreader.proofread_stream("Original text")) == ["Original text"]
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_stream_interrupted(self, mock_genai, proofreader):
+        """Test a stream that breaks midway raises instead of mixing in the original."""
+        def broken_stream():
+            yield Mock(text="Văn bản")
+            raise ConnectionError("Connection reset")
+        
+        mock_model = Mock()
+        mock_model.generate_content.return_value = broken_stream()
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        stream = proofreader.proofread_stream("Van ban")
+        assert next(stream) == "Văn bản"
+        with pytest.raises(APIError):
+            next(stream)
+    
+    @patch('core.proofreader.genai')
+    def test_proofread_async_error_fallback(self, mock_genai, proofreader):
+        """Test async proofreading falls back to original text on API errors."""
+        mock_model = Mock()
+        mock_model.generate_content_async = AsyncMock(side_effect=Exception("API Error"))
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        assert asyncio.run(proofreader.proofread_async("Original text")) == "Original text"
+    
+    @patch('core.proofreader.genai')
+    def test_system_prompt_sent_as_system_instruction(self, mock_genai, proofreader, mock_pii_masker):
+        """Test the system prompt is bound once per mode, not sent with each request."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        mock_model = Mock()
+        mock_model.generate_content.return_value = Mock(text="Corrected")
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        proofreader.proofread("Báo cáo kết quả quý I")
+        proofreader.proofread("Báo cáo kết quả quý II")
+        
+        instructions = [
+            call.kwargs['system_instruction']
+            for call in mock_genai.GenerativeModel.call_args_list
+            if 'system_instruction' in call.kwargs
+        ]
+        assert instructions == [Proofreader.SYSTEM_PROMPTS['business']]
+        mock_genai.caching.CachedContent.create.assert_not_called()
+        
+        prompt = mock_model.generate_content.call_args[0][0]
+        assert Proofreader.SYSTEM_PROMPTS['business'] not in prompt
+    
+    @patch('core.proofreader.genai')
+    def test_proofreaders_share_pooled_models(self, mock_genai, mock_keychain, mock_pii_masker):
+        """Test proofreaders with the same model and key share setup and mode models."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        mock_model = Mock()
+        mock_model.generate_content.return_value = Mock(text="Corrected")
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        first, second = (
+            Proofreader(keychain_manager=mock_keychain, pii_masker=mock_pii_masker)
+            for _ in range(2)
+        )
+        first.proofread("Văn bản một")
+        second.proofread("Văn bản hai")
+        
+        # One configure call for the key and one model for the 'minimal' mode
+        mock_genai.configure.assert_called_once_with(api_key="test_api_key_12345")
+        assert mock_genai.GenerativeModel.call_count == 1
+        assert first._get_mode_model('minimal') is second._get_mode_model('minimal')
+    
+    @patch('core.proofreader.genai')
+    def test_repeated_text_uses_response_cache(self, mock_genai, proofreader):
+        """Test identical requests are answered from the response cache."""
+        mock_model = Mock()
+        mock_model.generate_content.return_value = Mock(text="Corrected")
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        assert proofreader.proofread("Văn bản") == "Corrected"
+        assert proofreader.proofread("Văn bản") == "Corrected"
+        
+        # A single proofreading call
+        assert mock_model.generate_content.call_count == 1
+    
+    @patch('core.proofreader.RESPONSE_CACHE_SIZE', 2)
+    @patch('core.proofreader.genai')
+    def test_response_cache_evicts_least_recently_used(self, mock_genai, proofreader, mock_pii_masker):
+        """Test the response cache is bounded and evicts the oldest entry."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        mock_model = Mock()
+        mock_model.generate_content.return_value = Mock(text="Corrected")
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        for text in ["một", "hai", "ba"]:
+            proofreader.proofread(text)
+        assert len(proofreader._response_cache) == 2
+        
+        calls = mock_model.generate_content.call_count
+        proofreader.proofread("một")  # Evicted, goes to the API again
+        assert mock_model.generate_content.call_count == calls + 1
+    
+    def test_split_into_chunks_round_trip(self, proofreader):
+        """Test long text splits on paragraph boundaries and reassembles exactly."""
+        paragraphs = [f"Đoạn {i}: doanh thu 1.234,56 tỷ\ndòng thứ hai" for i in range(20)]
+        text = "\n\n".join(paragraphs)
+        
+        chunks = proofreader._split_into_chunks(text, max_chars=120)
+        
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 120 for chunk, _ in chunks)
+        assert all(separator == "\n\n" for _, separator in chunks[:-1])
+        assert "".join(chunk + separator for chunk, separator in chunks) == text
+    
+    def test_split_into_chunks_short_text(self, proofreader):
+        """Test short text is kept as a single chunk."""
+        assert proofreader._split_into_chunks("Văn bản ngắn") == [("Văn bản ngắn", "")]
+    
+    @patch('core.proofreader.CHUNK_MAX_CHARS', 60)
+    @patch('core.proofreader.genai')
+    def test_proofread_long_text_in_concurrent_chunks(self, mock_genai, proofreader, mock_pii_masker):
+        """Test long text is proofread chunk by chunk and stitched back together."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = (
+            lambda prompt, **kwargs: Mock(text=prompt.split("\n", 1)[1].upper())
+        )
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        text = "\n\n".join(f"đoạn văn số {i} cần hiệu đính" for i in range(6))
+        result = proofreader.proofread(text)
+        
+        assert result == text.upper()
+        assert mock_model.generate_content.call_count > 1
+    
+    @patch('core.proofreader.CHUNK_MAX_CHARS', 60)
+    @patch('core.proofreader.genai')
+    def test_long_text_blank_chunks_are_not_sent(self, mock_genai, proofreader, mock_pii_masker):
+        """Test leading and blank paragraphs of a long text are kept, not proofread."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = (
+            lambda prompt, **kwargs: Mock(text=prompt.split("\n", 1)[1].upper())
+        )
+        mock_model.generate_content_async = AsyncMock(
+            side_effect=lambda prompt, **kwargs: Mock(text=prompt.split("\n", 1)[1].upper())
+        )
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        # Paragraphs just under the chunk size keep the blank ones in chunks of their own
+        paragraph = "đoạn văn cần hiệu đính số một, hai và ba trong báo cáo này"
+        text = "\n\n" + paragraph + "\n\n   \n\n" + paragraph
+        chunks = proofreader._split_into_chunks(text)
+        assert ("", "\n\n") in chunks and ("   ", "\n\n") in chunks
+        
+        assert proofreader.proofread(text) == text.upper()
+        proofreader._response_cache.clear()
+        assert asyncio.run(proofreader.proofread_async(text)) == text.upper()
+        
+        prompts = [call.args[0] for call in mock_model.generate_content.call_args_list]
+        prompts += [call.args[0] for call in mock_model.generate_content_async.call_args_list]
+        assert prompts
+        assert all(prompt[len(Proofreader.REQUEST_PREFIX):].strip() for prompt in prompts)
+    
+    @patch('core.proofreader.CHUNK_MAX_CHARS', 60)
+    @patch('core.proofreader.genai')
+    def test_long_text_chunks_share_document_mode(self, mock_genai, proofreader, mock_pii_masker):
+        """Test every chunk is proofread in the mode detected for the whole text."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        mock_model = Mock()
+        mock_model.generate_content.return_value = Mock(text="Corrected")
+        mock_model.generate_content_async = AsyncMock(return_value=Mock(text="Corrected"))
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        # Only the first paragraph mentions money
+        text = "Doanh thu đạt 120 tỷ đồng\n\n" + "\n\n".join(
+            f"đoạn văn số {i} cần hiệu đính" for i in range(6)
+        )
+        
+        with patch.object(proofreader, '_get_mode_model', return_value=mock_model) as get_mode_model:
+            proofreader.proofread(text)
+            proofreader._response_cache.clear()
+            asyncio.run(proofreader.proofread_async(text))
+        
+        modes = {call.args[0] for call in get_mode_model.call_args_list}
+        assert modes == {'number_lock'}
+    
+    def _batch_job(self, state, texts=()):
+        """Build a mock Batch API job in the given state."""
+        job = Mock()
+        job.name = "batches/test-job"
+        job.state.name = state
+        job.dest.inlined_responses = [Mock(response=Mock(text=f" {text} ")) for text in texts]
+        return job
+    
+    @patch('google.genai', create=True)
+    def test_proofread_bulk_uses_batch_api(self, mock_google_genai, mock_keychain, mock_pii_masker):
+        """Test bulk proofreading submits one batch job and keeps input order."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        proofreader = Proofreader(
+            keychain_manager=mock_keychain,
+            pii_masker=mock_pii_masker,
+            enabled_batch_mode=True
+        )
+        client = mock_google_genai.Client.return_value
+        client.batches.create.return_value = self._batch_job("JOB_STATE_SUCCEEDED", ["một!", "hai!"])
+        
+        results = proofreader.proofread_bulk(["một", "", "hai"])
+        
+        assert results == ["một!", "", "hai!"]
+        mock_google_genai.Client.assert_called_once_with(api_key="test_api_key_12345")
+        src = client.batches.create.call_args[1]['src']
+        assert len(src) == 2
+        assert src[0]['config']['system_instruction'] == Proofreader.SYSTEM_PROMPTS['minimal']
+    
+    @patch('core.proofreader.BATCH_POLL_INTERVAL', 0)
+    @patch('core.proofreader.BATCH_MAX_REQUESTS', 2)
+    @patch('google.genai', create=True)
+    def test_proofread_bulk_partitions_and_polls(self, mock_google_genai, mock_keychain, mock_pii_masker):
+        """Test inputs are split across jobs and running jobs are polled."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        proofreader = Proofreader(
+            keychain_manager=mock_keychain,
+            pii_masker=mock_pii_masker,
+            enabled_batch_mode=True
+        )
+        client = mock_google_genai.Client.return_value
+        client.batches.create.side_effect = [
+            self._batch_job("JOB_STATE_RUNNING"),
+            self._batch_job("JOB_STATE_FAILED"),
+        ]
+        client.batches.get.return_value = self._batch_job("JOB_STATE_SUCCEEDED", ["A", "B"])
+        
+        results = proofreader.proofread_bulk(["a", "b", "c"])
+        
+        assert client.batches.create.call_count == 2
+        client.batches.get.assert_called_once_with(name="batches/test-job")
+        assert results == ["A", "B", "c"]  # The failed job keeps the original text
+    
+    @patch('core.proofreader.BATCH_POLL_INTERVAL', 0)
+    @patch('core.proofreader.BATCH_MAX_WAIT', 0)
+    @patch('google.genai', create=True)
+    def test_proofread_bulk_cancels_job_past_max_wait(self, mock_google_genai, mock_keychain, mock_pii_masker):
+        """Test a job still running after BATCH_MAX_WAIT is cancelled and skipped."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        proofreader = Proofreader(
+            keychain_manager=mock_keychain,
+            pii_masker=mock_pii_masker,
+            enabled_batch_mode=True
+        )
+        client = mock_google_genai.Client.return_value
+        client.batches.create.return_value = self._batch_job("JOB_STATE_RUNNING")
+        
+        results = proofreader.proofread_bulk(["a"])
+        
+        assert results == ["a"]
+        client.batches.cancel.assert_called_once_with(name="batches/test-job")
+        client.batches.get.assert_not_called()
+    
+    @patch('google.genai', create=True)
+    def test_proofread_bulk_honors_cancel_token(self, mock_google_genai, mock_keychain, mock_pii_masker):
+        """Test cancelling the token stops waiting and cancels the running job."""
+        mock_pii_masker.mask_for_cloud.side_effect = lambda text: text
+        proofreader = Proofreader(
+            keychain_manager=mock_keychain,
+            pii_masker=mock_pii_masker,
+            enabled_batch_mode=True
+        )
+        client = mock_google_genai.Client.return_value
+        client.batches.create.return_value = self._batch_job("JOB_STATE_RUNNING")
+        token = CancelToken()
+        token.cancel()
+        
+        with pytest.raises(OperationCancelledError):
+            proofreader.proofread_bulk(["a", "b"], cancel_token=token)
+        
+        client.batches.cancel.assert_called_once_with(name="batches/test-job")
+        client.batches.get.assert_not_called()
+    
+    def test_proofread_bulk_without_google_genai(self, mock_keychain, mock_pii_masker):
+        """Test batch mode degrades to the original text when google-genai is missing."""
+        proofreader = Proofreader(
+            keychain_manager=mock_keychain,
+            pii_masker=mock_pii_masker,
+            enabled_batch_mode=True
+        )
+        
+        import google
+        with patch.dict('sys.modules', {'google.genai': None}), patch.dict(google.__dict__):
+            google.__dict__.pop('genai', None)
+            with pytest.raises(APIValidationError, match="google-genai"):
+                proofreader._get_batch_client()
+            assert proofreader.proofread_bulk(["a"]) == ["a"]
+    
+    def test_proofread_bulk_disabled_falls_back(self, proofreader):
+        """Test bulk proofreading without batch mode proofreads each text directly."""
+        with patch.object(proofreader, 'proofread', side_effect=lambda text: text.upper()) as mock_proofread:
+            assert proofreader.proofread_bulk(["a", "b"]) == ["A", "B"]
+        assert mock_proofread.call_count == 2
 
 
 class TestProofreaderIntegration:
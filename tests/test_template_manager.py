@@ -4,6 +4,7 @@ Unit tests for template management system.
 
 import pytest
 import json
+import os
 import tempfile
 import shutil
 from pathlib import Path
@@ -12,6 +13,7 @@ from unittest.mock import patch, MagicMock
 from core.template_manager import TemplateManager
 from core.models import ExtractionTemplate, ExtractionField, FieldType
 from core.exceptions import ConfigurationError, ValidationError
+from core.utils import safe_json_load
 
 
 class TestTemplateManager:
@@ -162,6 +164,28 @@ class TestTemplateManager:
         assert "Financial Report" in templates
         assert templates == sorted(templates)  # Should be sorted
     
+    def test_list_templates_ignores_other_entries(self, template_manager, sample_template, temp_dir):
+        """Test listing skips non-JSON files and directories."""
+        template_manager.save_template(sample_template)
+        (temp_dir / "notes.txt").write_text("not a template")
+        (temp_dir / "folder.json").mkdir()
+        
+        assert template_manager.list_templates() == ["Financial Report"]
+    
+    def test_list_template_infos(self, template_manager, sample_template, temp_dir):
+        """Test listing templates with file details."""
+        template_manager.save_template(sample_template)
+        sample_template.name = "Another Template"
+        template_manager.save_template(sample_template)
+        (temp_dir / "notes.txt").write_text("not a template")
+        
+        infos = template_manager.list_template_infos()
+        
+        assert [info['name'] for info in infos] == ["Another Template", "Financial Report"]
+        template_file = temp_dir / "Financial Report.json"
+        assert infos[1]['file_size'] == template_file.stat().st_size
+        assert infos[1]['modified_time'] == template_file.stat().st_mtime
+    
     def test_delete_template_success(self, template_manager, sample_template):
         """Test successful template deletion."""
         # Save template first
@@ -209,6 +233,61 @@ class TestTemplateManager:
         info = template_manager.get_template_info("NonExistent")
         assert info is None
     
+    def test_template_info_reuses_parsed_file(self, template_manager, sample_template):
+        """Test unchanged template files are parsed only once for their metadata."""
+        template_manager.save_template(sample_template)
+        
+        with patch('core.template_manager.safe_json_load', wraps=safe_json_load) as mock_load:
+            first = template_manager.get_template_info("Financial Report")
+            second = template_manager.get_template_info("Financial Report")
+        
+        assert mock_load.call_count == 1
+        assert first == second
+    
+    def test_loaded_templates_do_not_share_state(self, template_manager, sample_template):
+        """Test editing a loaded template does not affect later loads."""
+        template_manager.save_template(sample_template)
+        template_manager.get_template_info("Financial Report")
+        
+        first = template_manager.load_template("Financial Report")
+        second = template_manager.load_template("Financial Report")
+        assert first is not second
+        
+        first.examples.append({"text": "sample"})
+        first.examples[0]["company_name"] = "Edited Corp"
+        first.provider["model"] = "edited-model"
+        first.run_options["temperature"] = 0.9
+        
+        third = template_manager.load_template("Financial Report")
+        for template in (second, third):
+            assert template.examples == [{"company_name": "ABC Corp", "revenue": "1000000"}]
+            assert template.provider["model"] == "gemini-2.5-pro"
+            assert template.run_options["temperature"] == 0.1
+    
+    def test_load_template_rereads_modified_file(self, template_manager, sample_template, temp_dir):
+        """Test a template edited on disk is parsed again."""
+        template_manager.save_template(sample_template)
+        template_manager.load_template("Financial Report")
+        
+        template_file = temp_dir / "Financial Report.json"
+        data = json.loads(template_file.read_text(encoding='utf-8'))
+        data['prompt_description'] = "Updated description"
+        template_file.write_text(json.dumps(data), encoding='utf-8')
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        loaded = template_manager.load_template("Financial Report")
+        assert loaded.prompt_description == "Updated description"
+    
+    def test_deleted_template_is_not_served_from_cache(self, template_manager, sample_template):
+        """Test deleting a template drops its cached data."""
+        template_manager.save_template(sample_template)
+        template_manager.load_template("Financial Report")
+        
+        template_manager.delete_template("Financial Report")
+        
+        assert template_manager.load_template("Financial Report") is None
+    
     def test_duplicate_template_success(self, template_manager, sample_template):
         """Test successful template duplication."""
         # Save original template
@@ -225,6 +304,9 @@ class TestTemplateManager:
         assert duplicated.name == "Financial Report Copy"
         assert duplicated.prompt_description == sample_template.prompt_description
         assert len(duplicated.fields) == len(sample_template.fields)
+        assert duplicated.examples == sample_template.examples
+        assert duplicated.provider == sample_template.provider
+        assert duplicated.run_options == sample_template.run_options
     
     def test_duplicate_template_source_not_found(self, template_manager):
         """Test duplicating non-existent template."""
@@ -285,6 +367,18 @@ class TestTemplateManager:
         
         assert "Field 1 description must be a string" in str(exc_info.value)
     
+    def test_save_and_load_vietnamese_text(self, template_manager, sample_template, temp_dir):
+        """Test Vietnamese text round-trips and is stored as readable UTF-8."""
+        sample_template.prompt_description = "Trích xuất thông tin tài chính"
+        template_manager.save_template(sample_template)
+        
+        raw = (temp_dir / "Financial Report.json").read_text(encoding='utf-8')
+        assert "Trích xuất thông tin tài chính" in raw
+        assert "\n" not in raw  # Templates are stored compactly
+        
+        loaded = template_manager.load_template("Financial Report")
+        assert loaded.prompt_description == "Trích xuất thông tin tài chính"
+    
     @patch('core.template_manager.safe_json_save')
     def test_save_template_io_error(self, mock_save, template_manager, sample_template):
         """Test handling of IO errors during save."""